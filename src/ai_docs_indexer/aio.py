@@ -0,0 +1,229 @@
+"""Asyncio scanning and rendering API."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator
+
+from .formatters import Formatter, IndexData
+from .scanner import ScanResult, _list_directory, _resolve_root, _ScanState
+
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+"""Worker threads in the shared executor used when none is passed."""
+
+DEFAULT_PREFETCH = 8
+"""Directory listings each scan keeps queued ahead of the walk."""
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> Executor:
+    """
+    Return the executor shared by all async scans and renders.
+
+    It is created on first use with :data:`DEFAULT_MAX_WORKERS` threads, so
+    concurrent scans draw from one worker budget instead of each starting
+    their own threads.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_WORKERS,
+                thread_name_prefix="ai-docs-indexer",
+            )
+        return _executor
+
+
+async def _walk(
+    state: _ScanState,
+    executor: Executor | None,
+    prefetch: int,
+) -> AsyncIterator[tuple[str, list[str]]]:
+    """Walk ``state.root`` in os.walk order, listing directories in the executor."""
+    loop = asyncio.get_running_loop()
+    executor = executor or get_executor()
+    pending: dict[str, asyncio.Future] = {}
+    stack = [str(state.root)]
+
+    def submit(dirpath: str) -> None:
+        if dirpath not in pending:
+            pending[dirpath] = loop.run_in_executor(executor, _list_directory, dirpath, state)
+
+    try:
+        while stack and not state.stopped:
+            dirpath = stack.pop()
+            submit(dirpath)
+            # Queue the next few directories while this one is awaited
+            for upcoming in stack[-1:-prefetch - 1:-1]:
+                submit(upcoming)
+
+            future = pending.pop(dirpath)
+            if state.deadline is None:
+                listing = await future
+            else:
+                remaining = state.deadline - time.monotonic()
+                try:
+                    listing = await asyncio.wait_for(future, max(remaining, 0))
+                except asyncio.TimeoutError:
+                    state.expire()
+                    break
+            if listing is None:
+                continue
+
+            dirnames = listing.dirnames
+            files = state.visit(
+                Path(dirpath).relative_to(state.root),
+                dirnames,
+                listing.filenames,
+                listing.dir_id,
+                listing.file_ids.get,
+                listing.file_stats,
+            )
+            if files:
+                rel_dir = os.path.relpath(dirpath, state.root)
+                yield ("" if rel_dir == "." else rel_dir), files
+
+            # Push children in reverse so they pop in sorted order
+            for dirname in reversed(dirnames):
+                if state.follow_symlinks or dirname not in listing.symlinks:
+                    stack.append(os.path.join(dirpath, dirname))
+    finally:
+        for future in pending.values():
+            future.cancel()
+
+
+async def iter_directory(
+    path: str | Path,
+    extensions: tuple[str, ...] = (".md", ".mdx"),
+    include_hidden: bool = False,
+    follow_symlinks: bool = False,
+    dedupe_files: bool = False,
+    max_depth: int | None = None,
+    max_files: int | None = None,
+    max_dirs: int | None = None,
+    timeout: float | None = None,
+    executor: Executor | None = None,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> AsyncIterator[tuple[str, list[str]]]:
+    """
+    Yield ``(directory, files)`` entries as the walk discovers them.
+
+    Directory listings run in ``executor`` (the shared executor by default)
+    with up to ``prefetch`` listings queued ahead, and entries are yielded in
+    the same order and with the same filtering as :func:`scan_directory`.
+    Cancelling the consuming task cancels the queued listings. When
+    ``timeout`` elapses, including while a listing is being awaited, the
+    walk ends early as with the other budgets.
+
+    Args:
+        path: The directory path to scan.
+        extensions: File extensions to include (with leading dot).
+        include_hidden: Whether to include hidden files/directories.
+        follow_symlinks: Whether to follow symbolic links.
+        dedupe_files: Whether to list linked copies of a file only once.
+        max_depth: Deepest directory level to descend into.
+        max_files: Maximum number of files to list.
+        max_dirs: Maximum number of directories to visit.
+        timeout: Maximum wall-clock seconds to spend walking.
+        executor: Executor for blocking filesystem calls.
+        prefetch: Directory listings to queue ahead of the walk.
+
+    Yields:
+        Tuples of relative directory path and its matching files.
+
+    Raises:
+        ValueError: If path doesn't exist or isn't a directory.
+    """
+    state = await _start(
+        path, extensions, include_hidden, follow_symlinks, dedupe_files,
+        max_depth, max_files, max_dirs, timeout, executor,
+    )
+    async for entry in _walk(state, executor, prefetch):
+        yield entry
+
+
+async def scan_directory_async(
+    path: str | Path,
+    extensions: tuple[str, ...] = (".md", ".mdx"),
+    include_hidden: bool = False,
+    follow_symlinks: bool = False,
+    dedupe_files: bool = False,
+    max_depth: int | None = None,
+    max_files: int | None = None,
+    max_dirs: int | None = None,
+    timeout: float | None = None,
+    stat_files: bool = False,
+    executor: Executor | None = None,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> ScanResult:
+    """
+    Asyncio counterpart of :func:`scan_directory`.
+
+    Takes the same arguments as :func:`iter_directory`, plus ``stat_files``
+    as in :func:`scan_directory`, and returns the complete (or, if a budget
+    tripped, truncated) ScanResult.
+    """
+    state = await _start(
+        path, extensions, include_hidden, follow_symlinks, dedupe_files,
+        max_depth, max_files, max_dirs, timeout, executor, stat_files,
+    )
+    async for _entry in _walk(state, executor, prefetch):
+        pass
+    return state.result()
+
+
+async def format_async(
+    formatter: Formatter,
+    data: IndexData,
+    executor: Executor | None = None,
+) -> str:
+    """
+    Render index data without blocking the event loop.
+
+    Args:
+        formatter: The formatter to use.
+        data: The index data to format.
+        executor: Executor to render in (the shared executor by default).
+
+    Returns:
+        The formatted string.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor or get_executor(), formatter.format, data)
+
+
+async def _start(
+    path: str | Path,
+    extensions: tuple[str, ...],
+    include_hidden: bool,
+    follow_symlinks: bool,
+    dedupe_files: bool,
+    max_depth: int | None,
+    max_files: int | None,
+    max_dirs: int | None,
+    timeout: float | None,
+    executor: Executor | None,
+    stat_files: bool = False,
+) -> _ScanState:
+    """Resolve the root off the event loop and set up the scan state."""
+    loop = asyncio.get_running_loop()
+    root = await loop.run_in_executor(executor or get_executor(), _resolve_root, path)
+    return _ScanState(
+        root,
+        extensions,
+        include_hidden,
+        follow_symlinks,
+        dedupe_files,
+        max_depth,
+        max_files,
+        max_dirs,
+        timeout,
+        stat_files,
+    )
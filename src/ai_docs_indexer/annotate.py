@@ -0,0 +1,111 @@
+"""Per-file size, line count and modification date annotations."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .cache import FileCache
+from .formatters import Annotation
+from .scanner import ScanResult
+
+ANNOTATION_FIELDS = ("size", "lines", "mtime")
+"""Annotation fields that can be requested, in display order."""
+
+# Bytes read per chunk when counting lines
+_LINE_CHUNK = 1 << 20
+
+
+def count_lines(path: str | Path) -> int:
+    """
+    Count the lines of a file by reading it in binary chunks.
+
+    A final line without a trailing newline is counted too.
+
+    Args:
+        path: The file to read.
+
+    Returns:
+        The number of lines.
+    """
+    lines = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        while chunk := f.read(_LINE_CHUNK):
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    return lines + (last != b"\n")
+
+
+def annotate(
+    result: ScanResult,
+    fields: tuple[str, ...] = ANNOTATION_FIELDS,
+    cache_path: str | Path | None = None,
+    workers: int | None = None,
+) -> dict[str, Annotation]:
+    """
+    Build annotations for every file of a scan.
+
+    Sizes and modification dates come from the stat data gathered during
+    the walk, so no file is stat'ed again. Line counts are read in parallel
+    and cached per file by size and mtime in ``cache_path``, so later runs
+    only read files that changed.
+
+    Args:
+        result: A scan made with ``stat_files=True``.
+        fields: Which of "size", "lines" and "mtime" to include.
+        cache_path: Optional JSON cache file for line counts.
+        workers: Maximum reader threads (default: ThreadPoolExecutor's).
+
+    Returns:
+        Mapping of relative file paths to annotations.
+
+    Raises:
+        ValueError: If the scan has no file stats or a field is unknown.
+    """
+    if result.file_stats is None:
+        raise ValueError("Annotations need a scan made with stat_files=True")
+    unknown = set(fields) - set(ANNOTATION_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown annotation fields: {', '.join(sorted(unknown))}")
+
+    lines: dict[str, int] = {}
+    if "lines" in fields:
+        cache = FileCache(cache_path)
+        pending = []
+        for rel_path, st in result.file_stats.items():
+            count = cache.get(rel_path, st)
+            if count is not None:
+                lines[rel_path] = count
+            elif st.st_size == 0:
+                cache.set(rel_path, st, 0)
+                lines[rel_path] = 0
+            else:
+                pending.append(rel_path)
+
+        def load(rel_path: str) -> int | None:
+            try:
+                return count_lines(os.path.join(result.root_path, rel_path))
+            except OSError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for rel_path, count in zip(pending, pool.map(load, pending)):
+                if count is not None:
+                    cache.set(rel_path, result.file_stats[rel_path], count)
+                    lines[rel_path] = count
+        cache.save()
+
+    annotations = {}
+    for rel_path, st in result.file_stats.items():
+        modified = None
+        if "mtime" in fields:
+            modified = datetime.fromtimestamp(st.st_mtime, timezone.utc).date().isoformat()
+        annotations[rel_path] = Annotation(
+            size=st.st_size if "size" in fields else None,
+            lines=lines.get(rel_path),
+            modified=modified,
+        )
+    return annotations
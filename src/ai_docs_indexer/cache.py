@@ -0,0 +1,91 @@
+"""Per-file result cache keyed by file size and modification time."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def default_cache_path(root: str | Path, kind: str) -> Path:
+    """
+    Return the default cache file for a scanned root.
+
+    Caches live under ``$XDG_CACHE_HOME/ai-docs-indexer`` (``~/.cache`` by
+    default), one file per root and kind, so the docs tree is never written to.
+
+    Args:
+        root: The scanned root directory.
+        kind: What is cached (e.g. "links").
+
+    Returns:
+        Path of the cache file (which may not exist yet).
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    digest = hashlib.sha1(str(Path(root).resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(base) / "ai-docs-indexer" / f"{kind}-{digest}.json"
+
+
+class FileCache:
+    """
+    JSON-backed cache of per-file values.
+
+    An entry is valid only while the file's size and ``st_mtime_ns`` match
+    the values recorded with it. Saving keeps only the entries looked up or
+    stored during this run, so deleted files drop out of the cache.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path is not None else None
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._used: set[str] = set()
+        self._dirty = False
+
+        if self.path is not None and self.path.exists():
+            try:
+                entries = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                entries = None
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    def get(self, key: str, st: os.stat_result) -> Any | None:
+        """Return the cached value for ``key`` if the file is unchanged, else None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.get("size") != st.st_size or entry.get("mtime_ns") != st.st_mtime_ns:
+            return None
+        self._used.add(key)
+        return entry.get("value")
+
+    def set(self, key: str, st: os.stat_result, value: Any) -> None:
+        """Store a value for ``key`` along with the file's size and mtime."""
+        self._entries[key] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "value": value,
+        }
+        self._used.add(key)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back to disk if it has a path and anything changed."""
+        if self.path is None:
+            return
+        if not self._dirty and self._used == set(self._entries):
+            return
+
+        entries = {key: self._entries[key] for key in sorted(self._used)}
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(entries))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # Caching is best-effort; an unwritable cache only costs speed
+            return
+        self._entries = entries
+        self._dirty = False
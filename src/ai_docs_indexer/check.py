@@ -0,0 +1,122 @@
+"""Staleness checks for committed indexes."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import replace
+from typing import Callable, Mapping, NamedTuple
+
+from .formatters import Formatter, IndexData
+from .scanner import ScanResult
+
+FINGERPRINT_KEY = "fingerprint"
+"""Metadata key under which ``scan --fingerprint`` records the fingerprint."""
+
+
+class CheckResult(NamedTuple):
+    """Outcome of comparing a committed index against the tree."""
+
+    fresh: bool
+    """Whether the committed index matches the tree."""
+
+    method: str
+    """How freshness was decided: "fingerprint" or "render"."""
+
+    fingerprint: str
+    """Fingerprint of the current tree."""
+
+
+def fingerprint(result: ScanResult, options: Mapping[str, object] | None = None) -> str:
+    """
+    Hash a raw scan and the options that turn it into an index.
+
+    The hash covers directory paths and file names in walk order, the
+    reason the walk was truncated, the given post-scan options, and, if the
+    scan was made with ``stat_files=True``, each file's size and mtime. It is
+    computed before links, series or annotations are processed, so a match
+    proves the index is unchanged without redoing that work.
+
+    Without stat data it changes whenever an indexed file is added, removed
+    or renamed, but not when file contents or modification times change.
+    Indexes whose content depends on the files (``--links``, ``--annotate``)
+    are hashed with stat data, so any edit or fresh checkout changes it.
+
+    Args:
+        result: A scan of the documentation tree.
+        options: Post-scan options the index is built with.
+
+    Returns:
+        A short digest such as ``sha256:1f0c9d2a7be84e53``.
+    """
+    digest = hashlib.sha256()
+    for dir_path, files in result.directories.items():
+        digest.update(os.fsencode(dir_path) + b"/\0")
+        for filename in files:
+            digest.update(os.fsencode(filename) + b"\0")
+        digest.update(b"\n")
+    digest.update(os.fsencode(f"{result.truncated}\n{sorted((options or {}).items())}\n"))
+    if result.file_stats is not None:
+        for rel_path, st in result.file_stats.items():
+            digest.update(os.fsencode(f"{rel_path}\0{st.st_size}\0{st.st_mtime_ns}\n"))
+    return f"sha256:{digest.hexdigest()[:16]}"
+
+
+def check_index(
+    text: str,
+    formatter: Formatter,
+    result: ScanResult,
+    build: Callable[[], IndexData],
+    options: Mapping[str, object] | None = None,
+    committed: IndexData | None = None,
+) -> CheckResult:
+    """
+    Check whether a committed index is up to date with a fresh scan.
+
+    If the index records a fingerprint that matches ``result`` and
+    ``options``, it is fresh and nothing else is done. Otherwise ``build``
+    is called to build the current index data, which is rendered with the
+    name, root, instruction and recorded fingerprint read back from the
+    index, and compared with the committed text in both regular and
+    ``--compress`` form, ignoring trailing newlines.
+
+    Args:
+        text: The committed index.
+        formatter: The formatter the index was written with.
+        result: A scan of the documentation tree.
+        build: Builds index data from ``result`` with the same options the
+            committed index was generated with.
+        options: Post-scan options, as passed to :func:`fingerprint`.
+        committed: ``text`` already parsed with ``formatter``, if available.
+
+    Returns:
+        CheckResult describing the outcome.
+
+    Raises:
+        ValueError: If the text is not valid output for the formatter.
+    """
+    if committed is None:
+        committed = formatter.parse(text)
+    current_fingerprint = fingerprint(result, options)
+
+    recorded = committed.metadata.get(FINGERPRINT_KEY)
+    if recorded == current_fingerprint:
+        return CheckResult(True, "fingerprint", current_fingerprint)
+
+    # A stale fingerprint alone (e.g. new mtimes after a fresh clone) does
+    # not make the listing stale
+    current = build()
+    metadata = {k: v for k, v in current.metadata.items() if k != FINGERPRINT_KEY}
+    if recorded is not None:
+        metadata[FINGERPRINT_KEY] = recorded
+    current = replace(
+        current,
+        name=committed.name,
+        root=committed.root,
+        instruction=committed.instruction,
+        metadata=metadata,
+    )
+
+    rendered = formatter.format(current).rstrip("\n")
+    fresh = text.rstrip("\n") in (rendered, rendered.replace("\n", ""))
+    return CheckResult(fresh, "render", current_fingerprint)
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import json
+import os
+import sys
 from pathlib import Path
 
 import click
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 
 from . import __version__
-from .formatters import IndexData, get_formatter
-from .scanner import scan_directory
+from .annotate import ANNOTATION_FIELDS, annotate
+from .cache import default_cache_path
+from .check import FINGERPRINT_KEY, check_index, fingerprint
+from .collapse import collapse_series, expand_directories, parse_series
+from .formatters import IndexData, available_formats, get_formatter
+from .links import LinkGraph, extract_links, rank_by_links, select_by_links
+from .scanner import ScanResult, rescan_paths, scan_directory, scan_manifest
+from .stats import compute_stats
 
 console = Console()
 
@@ -30,6 +40,101 @@ def parse_extensions(ctx, param, value: str | None) -> tuple[str, ...]:
     return tuple(extensions)
 
 
+def _index_options(
+    links: bool,
+    max_files: int | None,
+    collapse: bool,
+    annotate_fields: tuple[str, ...],
+) -> dict[str, object]:
+    """Collect the post-scan options of an index for its fingerprint."""
+    return {
+        "links": links,
+        "max_files": max_files,
+        "collapse": collapse,
+        "annotate": ",".join(annotate_fields),
+    }
+
+
+def _build_index(
+    result: ScanResult,
+    scan_path: Path,
+    name: str,
+    root: str,
+    instruction: str | None,
+    extensions: tuple[str, ...],
+    truncated: str | None,
+    links: bool = False,
+    max_files: int | None = None,
+    collapse: bool = False,
+    annotate_fields: tuple[str, ...] = (),
+    add_fingerprint: bool = False,
+) -> tuple[IndexData, LinkGraph | None]:
+    """
+    Apply the post-scan steps shared by ``scan`` and ``check``.
+
+    With ``links``, ``max_files`` keeps the most linked files across the
+    tree, so the scan itself should not be bounded by it.
+
+    Returns:
+        The index data, and the link graph if ``links`` is set.
+    """
+    directories = result.directories
+    metadata: dict[str, str] = {}
+    graph = None
+
+    if links:
+        graph = extract_links(
+            result,
+            extensions=extensions,
+            cache_path=default_cache_path(scan_path, "links"),
+        )
+        if max_files is not None and result.total_files > max_files:
+            directories = select_by_links(directories, graph, max_files)
+            truncated = truncated or f"max files ({max_files}) reached"
+        directories = rank_by_links(directories, graph)
+        link_count = sum(len(targets) for targets in graph.edges.values())
+        broken_count = sum(len(targets) for targets in graph.broken.values())
+        metadata["links"] = f"{link_count} links, {broken_count} broken"
+
+    annotations = {}
+    if annotate_fields:
+        # Only annotate the files --max-files kept after ranking
+        listed = {
+            os.path.join(dir_path, filename)
+            for dir_path, files in directories.items()
+            for filename in files
+        }
+        annotations = annotate(
+            result._replace(
+                file_stats={
+                    rel_path: st
+                    for rel_path, st in result.file_stats.items()
+                    if rel_path in listed
+                }
+            ),
+            annotate_fields,
+            cache_path=default_cache_path(scan_path, "lines"),
+        )
+
+    if collapse:
+        directories = collapse_series(directories)
+
+    index_data = IndexData(
+        name=name,
+        root=root,
+        directories=directories,
+        instruction=instruction,
+        metadata=metadata,
+        truncated=truncated,
+        annotations=annotations,
+    )
+    if add_fingerprint:
+        metadata[FINGERPRINT_KEY] = fingerprint(
+            result, _index_options(links, max_files, collapse, annotate_fields)
+        )
+    return index_data, graph
+
+
 @click.group()
 @click.version_option(version=__version__, prog_name="ai-docs-indexer")
 def main():
@@ -47,7 +152,7 @@ def main():
 @click.option(
     "-f", "--format",
     "formats",
-    type=click.Choice(["pipe", "json", "yaml"]),
+    type=click.Choice(available_formats()),
     multiple=True,
     default=["pipe"],
     help="Output format(s). Can be specified multiple times.",
@@ -80,6 +185,76 @@ def main():
     default=False,
     help="Follow symbolic links.",
 )
+@click.option(
+    "--dedupe/--no-dedupe",
+    default=False,
+    help="List hard-linked or symlinked copies of a file only once.",
+)
+@click.option(
+    "--changed-from",
+    type=click.Path(exists=True, dir_okay=False),
+    metavar="INDEX",
+    help="Previous index (in the first --format) to update instead of a full scan.",
+)
+@click.option(
+    "--paths-from-stdin",
+    is_flag=True,
+    help="Read changed paths from stdin, one per line (use with --changed-from).",
+)
+@click.option(
+    "--manifest",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Build the index from a NUL- or newline-separated file list instead of walking PATH.",
+)
+@click.option(
+    "--max-depth",
+    type=click.IntRange(min=0),
+    help="Deepest directory level to descend into (0 = root only).",
+)
+@click.option(
+    "--max-files",
+    type=click.IntRange(min=1),
+    help="Stop after listing this many files.",
+)
+@click.option(
+    "--max-dirs",
+    type=click.IntRange(min=1),
+    help="Stop after visiting this many directories.",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Stop scanning after this many seconds.",
+)
+@click.option(
+    "--links",
+    is_flag=True,
+    help="Parse relative links between docs, rank files by inbound links and report broken links.",
+)
+@click.option(
+    "--links-output",
+    type=click.Path(dir_okay=False),
+    help="Write the link graph as JSON to this file (implies --links).",
+)
+@click.option(
+    "--collapse-series",
+    "collapse",
+    is_flag=True,
+    help="Collapse numbered and versioned file runs into range expressions.",
+)
+@click.option(
+    "--annotate",
+    "annotate_fields",
+    type=click.Choice(ANNOTATION_FIELDS),
+    multiple=True,
+    help="Annotate files with their size, line count or mtime. Can be specified multiple times.",
+)
+@click.option(
+    "--fingerprint",
+    "add_fingerprint",
+    is_flag=True,
+    help="Record a fingerprint of the walk so `check` can skip rebuilding an unchanged index.",
+)
 @click.option(
     "--stdout",
     is_flag=True,
@@ -105,6 +280,19 @@ def scan(
     instruction: str | None,
     include_hidden: bool,
     follow_symlinks: bool,
+    dedupe: bool,
+    changed_from: str | None,
+    paths_from_stdin: bool,
+    manifest: str | None,
+    max_depth: int | None,
+    max_files: int | None,
+    max_dirs: int | None,
+    timeout: float | None,
+    links: bool,
+    links_output: str | None,
+    collapse: bool,
+    annotate_fields: tuple[str, ...],
+    add_fingerprint: bool,
     stdout: bool,
     quiet: bool,
     compress: bool,
@@ -117,16 +305,79 @@ def scan(
     scan_path = Path(path)
     root_path = root if root else f"./{scan_path.name}"
 
-    if not quiet:
-        console.print(f"[blue]Scanning[/] {scan_path}")
+    if bool(changed_from) != paths_from_stdin:
+        raise click.UsageError("--changed-from and --paths-from-stdin must be used together.")
+    if changed_from and dedupe:
+        raise click.UsageError("--dedupe cannot be combined with --changed-from.")
+    budgeted = any(v is not None for v in (max_depth, max_files, max_dirs, timeout))
+    if changed_from and budgeted:
+        raise click.UsageError(
+            "--max-depth, --max-files, --max-dirs and --timeout cannot be combined "
+            "with --changed-from."
+        )
+    if manifest and (changed_from or dedupe):
+        raise click.UsageError("--manifest cannot be combined with --changed-from or --dedupe.")
+    if manifest and (max_dirs is not None or timeout is not None or follow_symlinks):
+        raise click.UsageError(
+            "--max-dirs, --timeout and --follow-symlinks cannot be combined with --manifest."
+        )
+    if annotate_fields and (changed_from or manifest):
+        raise click.UsageError("--annotate cannot be combined with --changed-from or --manifest.")
+    # Keep the requested fields in display order
+    annotate_fields = tuple(f for f in ANNOTATION_FIELDS if f in annotate_fields)
+
+    # With --links, --max-files keeps the most linked files rather than the
+    # first ones walked, so the file budget is applied after ranking
+    ranked = bool(links or links_output)
+    walk_max_files = None if ranked else max_files
 
     try:
-        result = scan_directory(
-            scan_path,
-            extensions=extensions,
-            include_hidden=include_hidden,
-            follow_symlinks=follow_symlinks,
-        )
+        if changed_from:
+            previous = get_formatter(formats[0]).parse(Path(changed_from).read_text())
+            changed = [
+                line.strip() for line in sys.stdin if line.strip()
+            ]
+            if not quiet:
+                console.print(
+                    f"[blue]Updating[/] {scan_path} from {len(changed)} changed paths"
+                )
+            result = rescan_paths(
+                scan_path,
+                # A collapsed index lists range expressions, not files
+                expand_directories(previous.directories, scan_path),
+                changed,
+                extensions=extensions,
+                include_hidden=include_hidden,
+                follow_symlinks=follow_symlinks,
+            )
+        elif manifest:
+            if not quiet:
+                console.print(f"[blue]Reading[/] {manifest}")
+            result = scan_manifest(
+                manifest,
+                scan_path,
+                extensions=extensions,
+                include_hidden=include_hidden,
+                max_depth=max_depth,
+                max_files=walk_max_files,
+            )
+        else:
+            if not quiet:
+                console.print(f"[blue]Scanning[/] {scan_path}")
+            result = scan_directory(
+                scan_path,
+                extensions=extensions,
+                include_hidden=include_hidden,
+                follow_symlinks=follow_symlinks,
+                dedupe_files=dedupe,
+                max_depth=max_depth,
+                max_files=walk_max_files,
+                max_dirs=max_dirs,
+                timeout=timeout,
+                # Link ranking depends on file contents, so its fingerprint
+                # covers file sizes and mtimes
+                stat_files=bool(annotate_fields) or (add_fingerprint and ranked),
+            )
     except ValueError as e:
         console.print(f"[red]Error:[/] {e}")
         raise SystemExit(1)
@@ -136,15 +387,49 @@ def scan(
             f"[green]Found[/] {result.total_files} files "
             f"in {len(result.directories)} directories"
         )
+        if result.skipped:
+            console.print(
+                f"[yellow]Skipped[/] {len(result.skipped)} already-seen paths"
+            )
+            for skipped_path in result.skipped:
+                console.print(f"  [dim]{skipped_path}[/]")
+        if result.truncated:
+            console.print(f"[yellow]Truncated:[/] {result.truncated}")
 
-    # Build index data
-    index_data = IndexData(
-        name=name,
-        root=root_path,
-        directories=result.directories,
-        instruction=instruction,
+    # An updated partial index stays partial
+    truncated = result.truncated
+    if changed_from and previous.truncated:
+        truncated = previous.truncated
+
+    index_data, graph = _build_index(
+        result,
+        scan_path,
+        name,
+        root_path,
+        instruction,
+        extensions,
+        truncated,
+        links=ranked,
+        max_files=max_files,
+        collapse=collapse,
+        annotate_fields=annotate_fields,
+        add_fingerprint=add_fingerprint,
     )
 
+    if graph is not None:
+        if not quiet:
+            if index_data.truncated != truncated:
+                console.print(f"[yellow]Truncated:[/] kept the {max_files} most linked files")
+            console.print(f"[green]Linked[/] {index_data.metadata['links']}")
+            for source, targets in graph.broken.items():
+                for target in targets:
+                    console.print(f"  [yellow]broken[/] {source} -> {target}")
+
+        if links_output:
+            Path(links_output).write_text(json.dumps(graph._asdict(), indent=2))
+            if not quiet:
+                console.print(f"[green]Wrote[/] {links_output}")
+
     # Generate output for each format
     for format_name in formats:
         formatter = get_formatter(format_name)
@@ -173,14 +458,333 @@ def scan(
 
 
 @main.command()
-def formats():
-    """List available output formats."""
-    from .formatters import JsonFormatter, PipeFormatter, YamlFormatter
+@click.argument("path", type=click.Path(exists=True, file_okay=False, resolve_path=True))
+@click.option(
+    "-f", "--format",
+    "formats",
+    type=click.Choice(available_formats()),
+    multiple=True,
+    default=available_formats(),
+    help="Output format(s) to measure. Can be specified multiple times.",
+)
+@click.option(
+    "-n", "--name",
+    default="Documentation Index",
+    help="Name for the index.",
+)
+@click.option(
+    "-r", "--root",
+    help="Root path to use in output (default: scanned path).",
+)
+@click.option(
+    "-e", "--extensions",
+    callback=parse_extensions,
+    help="Comma-separated file extensions to include (default: .md,.mdx).",
+)
+@click.option(
+    "-i", "--instruction",
+    help="Instruction text for AI agents.",
+)
+@click.option(
+    "--include-hidden/--no-hidden",
+    default=False,
+    help="Include hidden files and directories.",
+)
+@click.option(
+    "--follow-symlinks/--no-follow-symlinks",
+    default=False,
+    help="Follow symbolic links.",
+)
+@click.option(
+    "-t", "--top",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Number of rows to show in each breakdown.",
+)
+def stats(
+    path: str,
+    formats: tuple[str, ...],
+    name: str,
+    root: str | None,
+    extensions: tuple[str, ...],
+    instruction: str | None,
+    include_hidden: bool,
+    follow_symlinks: bool,
+    top: int,
+):
+    """
+    Report index size per format and per directory.
+
+    PATH is the directory to scan for documentation files.
+    """
+    scan_path = Path(path)
+    root_path = root if root else f"./{scan_path.name}"
+
+    try:
+        result = scan_directory(
+            scan_path,
+            extensions=extensions,
+            include_hidden=include_hidden,
+            follow_symlinks=follow_symlinks,
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/] {e}")
+        raise SystemExit(1)
+
+    index_data = IndexData(
+        name=name,
+        root=root_path,
+        directories=result.directories,
+        instruction=instruction,
+    )
+    index_stats = compute_stats(index_data, formats)
+
+    console.print(
+        f"[bold]{result.total_files}[/] files in "
+        f"[bold]{len(result.directories)}[/] directories\n"
+    )
+
+    table = Table(title="Formats", title_justify="left")
+    table.add_column("Format", style="cyan")
+    table.add_column("Bytes", justify="right")
+    table.add_column("~Tokens", justify="right")
+    for format_name, size in index_stats.formats.items():
+        table.add_row(format_name, f"{size.bytes:,}", f"{size.tokens:,}")
+    console.print(table)
+
+    total_bytes = sum(d.bytes for d in index_stats.directories.values()) or 1
+
+    table = Table(title="Largest subtrees (pipe entries)", title_justify="left")
+    table.add_column("Directory", style="cyan")
+    table.add_column("Files", justify="right")
+    table.add_column("Bytes", justify="right")
+    table.add_column("~Tokens", justify="right")
+    table.add_column("Share", justify="right")
+    subtrees = sorted(
+        index_stats.directories.values(),
+        key=lambda d: (-d.subtree_bytes, d.path),
+    )
+    for d in subtrees[:top]:
+        table.add_row(
+            d.path or ".",
+            f"{d.subtree_files:,}",
+            f"{d.subtree_bytes:,}",
+            f"{d.subtree_tokens:,}",
+            f"{d.subtree_bytes / total_bytes:.1%}",
+        )
+    console.print(table)
+
+    table = Table(title="Largest file lists", title_justify="left")
+    table.add_column("Directory", style="cyan")
+    table.add_column("Files", justify="right")
+    table.add_column("Bytes", justify="right")
+    table.add_column("~Tokens", justify="right")
+    lists = sorted(
+        (d for d in index_stats.directories.values() if d.files),
+        key=lambda d: (-d.files, d.path),
+    )
+    for d in lists[:top]:
+        table.add_row(d.path or ".", f"{d.files:,}", f"{d.bytes:,}", f"{d.tokens:,}")
+    console.print(table)
+
+    repeated = [
+        (filename, count)
+        for filename, count in index_stats.name_counts.most_common()
+        if count > 1
+    ]
+    if repeated:
+        table = Table(title="Repeated filenames", title_justify="left")
+        table.add_column("Filename", style="cyan")
+        table.add_column("Count", justify="right")
+        for filename, count in repeated[:top]:
+            table.add_row(filename, f"{count:,}")
+        console.print(table)
+
+
+@main.command()
+@click.argument("path", type=click.Path(exists=True, file_okay=False, resolve_path=True))
+@click.option(
+    "--against",
+    type=click.Path(exists=True, dir_okay=False),
+    required=True,
+    metavar="INDEX",
+    help="Committed index file to check.",
+)
+@click.option(
+    "-f", "--format",
+    "format_name",
+    type=click.Choice(available_formats()),
+    default="pipe",
+    help="Format the index was written in.",
+)
+@click.option(
+    "-e", "--extensions",
+    callback=parse_extensions,
+    help="Comma-separated file extensions to include (default: .md,.mdx).",
+)
+@click.option(
+    "--include-hidden/--no-hidden",
+    default=False,
+    help="Include hidden files and directories.",
+)
+@click.option(
+    "--follow-symlinks/--no-follow-symlinks",
+    default=False,
+    help="Follow symbolic links.",
+)
+@click.option(
+    "--dedupe/--no-dedupe",
+    default=False,
+    help="List hard-linked or symlinked copies of a file only once.",
+)
+@click.option(
+    "--links",
+    is_flag=True,
+    help="Rank files by inbound links, as scan --links does.",
+)
+@click.option(
+    "--collapse-series",
+    "collapse",
+    is_flag=True,
+    help="Collapse numbered and versioned file runs, as scan --collapse-series does.",
+)
+@click.option(
+    "--max-depth",
+    type=click.IntRange(min=0),
+    help="Deepest directory level to descend into (0 = root only).",
+)
+@click.option(
+    "--max-files",
+    type=click.IntRange(min=1),
+    help="Stop after listing this many files.",
+)
+@click.option(
+    "--max-dirs",
+    type=click.IntRange(min=1),
+    help="Stop after visiting this many directories.",
+)
+@click.option(
+    "-q", "--quiet",
+    is_flag=True,
+    help="Suppress status messages.",
+)
+def check(
+    path: str,
+    against: str,
+    format_name: str,
+    extensions: tuple[str, ...],
+    include_hidden: bool,
+    follow_symlinks: bool,
+    dedupe: bool,
+    links: bool,
+    collapse: bool,
+    max_depth: int | None,
+    max_files: int | None,
+    max_dirs: int | None,
+    quiet: bool,
+):
+    """
+    Check that a committed index is up to date.
 
-    formatters = [PipeFormatter(), JsonFormatter(), YamlFormatter()]
+    PATH is the documentation directory the index was generated from. Exits
+    with status 1 if the index is stale. Pass the same scan options that were
+    used to generate it.
+    """
+    scan_path = Path(path)
+    formatter = get_formatter(format_name)
+    text = Path(against).read_text()
+    try:
+        committed = formatter.parse(text)
+    except ValueError as e:
+        console.print(f"[red]Error:[/] {e}")
+        raise SystemExit(1)
+
+    # Refuse indexes the given options cannot reproduce rather than
+    # reporting them stale
+    if committed.truncated and committed.truncated.startswith("timeout"):
+        raise click.UsageError(
+            f"{against} was cut short by --timeout and cannot be checked."
+        )
+    if committed.truncated and max_depth is None and max_files is None and max_dirs is None:
+        raise click.UsageError(
+            f"{against} is truncated ({committed.truncated}); pass the same "
+            "--max-depth, --max-files or --max-dirs it was generated with."
+        )
+    if "links" in committed.metadata and not links:
+        raise click.UsageError(f"{against} was generated with --links; pass --links.")
+    if not collapse and any(
+        parse_series(entry) is not None
+        for files in committed.directories.values()
+        for entry in files
+    ):
+        raise click.UsageError(
+            f"{against} was generated with --collapse-series; pass --collapse-series."
+        )
+
+    # Rebuild the annotation fields that appear in the committed index
+    # (ANNOTATION_FIELDS follows the order of Annotation's fields)
+    annotate_fields = tuple(
+        field
+        for i, field in enumerate(ANNOTATION_FIELDS)
+        if any(a[i] is not None for a in committed.annotations.values())
+    )
+
+    try:
+        result = scan_directory(
+            scan_path,
+            extensions=extensions,
+            include_hidden=include_hidden,
+            follow_symlinks=follow_symlinks,
+            dedupe_files=dedupe,
+            max_depth=max_depth,
+            max_files=None if links else max_files,
+            max_dirs=max_dirs,
+            # Stat the files as scan did for the fingerprint
+            stat_files=bool(annotate_fields) or (links and FINGERPRINT_KEY in committed.metadata),
+        )
+        outcome = check_index(
+            text,
+            formatter,
+            result,
+            lambda: _build_index(
+                result,
+                scan_path,
+                committed.name,
+                committed.root,
+                committed.instruction,
+                extensions,
+                result.truncated,
+                links=links,
+                max_files=max_files,
+                collapse=collapse,
+                annotate_fields=annotate_fields,
+            )[0],
+            _index_options(links, max_files, collapse, annotate_fields),
+            committed,
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/] {e}")
+        raise SystemExit(1)
 
+    if outcome.fresh:
+        if not quiet:
+            console.print(f"[green]Up to date[/] {against} (by {outcome.method})")
+        return
+
+    if not quiet:
+        console.print(
+            f"[red]Stale[/] {against} (by {outcome.method}); "
+            f"{result.total_files} files now in {len(result.directories)} directories"
+        )
+    raise SystemExit(1)
+
+
+@main.command()
+def formats():
+    """List available output formats."""
     console.print("[bold]Available formats:[/]\n")
-    for f in formatters:
+    for f in map(get_formatter, available_formats()):
         console.print(f"  [cyan]{f.name}[/] - {f.file_extension} files")
 
 
@@ -0,0 +1,302 @@
+"""Collapsing of numbered and versioned file series into range expressions."""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+_SEMVER_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+_NUMBER_RE = re.compile(r"\d+")
+_EXPR_RE = re.compile(r"^\{(.+) \((\d+)\)\}$")
+_SEMVER_END_RE = re.compile(r"\d+\.\d+\.\d+$")
+_NUMBER_END_RE = re.compile(r"\d+$")
+
+
+class Series(NamedTuple):
+    """A collapsed run of files sharing a name template."""
+
+    kind: str
+    """Either "number" or "semver"."""
+
+    prefix: str
+    """Text before the varying part."""
+
+    first: str
+    """Lowest value of the varying part, as written."""
+
+    last: str
+    """Highest value of the varying part, as written."""
+
+    suffix: str
+    """Text after the varying part, including the extension."""
+
+    count: int
+    """Number of files in the series."""
+
+    def __str__(self) -> str:
+        return (
+            f"{{{self.prefix}{self.first}..{self.prefix}{self.last}{self.suffix} "
+            f"({self.count})}}"
+        )
+
+
+def _template(filename: str) -> tuple[str, str, str, str] | None:
+    """Split a filename into (kind, prefix, varying part, suffix)."""
+    stem_end = len(os.path.splitext(filename)[0])
+    match = None
+    for match in _SEMVER_RE.finditer(filename, 0, stem_end):
+        pass
+    if match is not None:
+        kind = "semver"
+    else:
+        for match in _NUMBER_RE.finditer(filename, 0, stem_end):
+            pass
+        if match is None:
+            return None
+        kind = "number"
+    return kind, filename[:match.start()], match.group(), filename[match.end():]
+
+
+def _semver_key(version: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in version.split("."))
+
+
+def _number_series(prefix: str, values: list[str], suffix: str) -> Series | None:
+    """Build a numeric series if the values are contiguous and consistently padded."""
+    numbers = [int(v) for v in values]
+    low, high = min(numbers), max(numbers)
+    if high - low + 1 != len(values) or len(set(numbers)) != len(values):
+        return None
+
+    padded = any(len(v) > 1 and v.startswith("0") for v in values)
+    if padded:
+        if len({len(v) for v in values}) != 1:
+            return None
+        width = len(values[0])
+        first, last = str(low).zfill(width), str(high).zfill(width)
+    else:
+        first, last = str(low), str(high)
+    return Series("number", prefix, first, last, suffix, len(values))
+
+
+def collapse_files(files: list[str], min_run: int = 3) -> list[str]:
+    """
+    Replace numbered or versioned runs in one directory with range expressions.
+
+    Files are grouped by template (the name with its last semver, or else
+    its last number, taken out) in a single pass. Numeric groups collapse
+    only when their numbers are contiguous and consistently padded, so
+    they can be expanded exactly; semver groups always collapse. Each
+    expression takes the position of the first file of its series.
+
+    Args:
+        files: Filenames in one directory.
+        min_run: Smallest group size to collapse.
+
+    Returns:
+        The file list with series replaced by expressions such as
+        ``{v0.1.0..v4.12.3.md (212)}``.
+    """
+    groups: dict[tuple[str, str, str], list[int]] = {}
+    parts: list[tuple[str, str, str, str] | None] = []
+    for index, filename in enumerate(files):
+        template = _template(filename)
+        parts.append(template)
+        if template is not None:
+            kind, prefix, _value, suffix = template
+            groups.setdefault((kind, prefix, suffix), []).append(index)
+
+    replaced: dict[int, str] = {}
+    skip: set[int] = set()
+    for (kind, prefix, suffix), members in groups.items():
+        if len(members) < min_run:
+            continue
+        values = [parts[i][2] for i in members]
+        if kind == "semver":
+            series = Series(
+                "semver",
+                prefix,
+                min(values, key=_semver_key),
+                max(values, key=_semver_key),
+                suffix,
+                len(values),
+            )
+        else:
+            series = _number_series(prefix, values, suffix)
+            if series is None:
+                continue
+        replaced[members[0]] = str(series)
+        skip.update(members[1:])
+
+    if not replaced:
+        return files
+    return [
+        replaced.get(index, filename)
+        for index, filename in enumerate(files)
+        if index not in skip
+    ]
+
+
+def collapse_series(
+    directories: dict[str, list[str]],
+    min_run: int = 3,
+) -> dict[str, list[str]]:
+    """
+    Collapse file series in every directory.
+
+    Args:
+        directories: Mapping of directory paths to file lists.
+        min_run: Smallest group size to collapse.
+
+    Returns:
+        A new mapping with series replaced by range expressions.
+    """
+    return {
+        dir_path: collapse_files(files, min_run)
+        for dir_path, files in directories.items()
+    }
+
+
+def parse_series(entry: str) -> Series | None:
+    """
+    Parse a range expression produced by :func:`collapse_files`.
+
+    Args:
+        entry: A file list entry.
+
+    Returns:
+        The Series, or None if the entry is an ordinary filename.
+    """
+    match = _EXPR_RE.match(entry)
+    if match is None:
+        return None
+    body, count = match.group(1), int(match.group(2))
+
+    # The prefix may itself contain "..", so try every split point and keep
+    # the first one whose bounds are consistent with the count
+    split = body.find("..")
+    while split != -1:
+        series = _parse_bounds(body[:split], body[split + 2:], count)
+        if series is not None and str(series) == entry:
+            if series.kind == "number":
+                consistent = int(series.last) - int(series.first) + 1 == count
+            else:
+                consistent = _semver_key(series.first) <= _semver_key(series.last)
+            if consistent:
+                return series
+        split = body.find("..", split + 1)
+    return None
+
+
+def _parse_bounds(left: str, right: str, count: int) -> Series | None:
+    """Parse the first and last filename of a range expression."""
+    end = _SEMVER_END_RE.search(left)
+    kind = "semver"
+    if end is None:
+        end = _NUMBER_END_RE.search(left)
+        kind = "number"
+        if end is None:
+            return None
+    prefix, first = left[:end.start()], end.group()
+    if not right.startswith(prefix):
+        return None
+
+    rest = right[len(prefix):]
+    pattern = _SEMVER_RE if kind == "semver" else _NUMBER_RE
+    last = pattern.match(rest)
+    if last is None:
+        return None
+    return Series(kind, prefix, first, last.group(), rest[last.end():], count)
+
+
+def expand_series(entry: str, candidates: Iterable[str] | None = None) -> list[str]:
+    """
+    Expand a range expression back into filenames.
+
+    Numeric series are contiguous by construction and expand on their own.
+    Semver series record only their endpoints, so the directory's actual
+    filenames must be given as ``candidates``; the members of the series
+    are then picked from them. Ordinary filenames expand to themselves.
+
+    Args:
+        entry: A file list entry.
+        candidates: Filenames to select semver series members from.
+
+    Returns:
+        The filenames the entry stands for.
+
+    Raises:
+        ValueError: If a semver series is expanded without candidates.
+    """
+    series = parse_series(entry)
+    if series is None:
+        return [entry]
+
+    if series.kind == "number":
+        width = len(series.first) if series.first.startswith("0") and len(series.first) > 1 else 0
+        return [
+            f"{series.prefix}{str(n).zfill(width)}{series.suffix}"
+            for n in range(int(series.first), int(series.last) + 1)
+        ]
+
+    if candidates is None:
+        raise ValueError(f"Semver series {entry} needs the directory listing to expand")
+    low, high = _semver_key(series.first), _semver_key(series.last)
+    members = []
+    for filename in candidates:
+        template = _template(filename)
+        if template is None:
+            continue
+        kind, prefix, value, suffix = template
+        if (
+            kind == "semver"
+            and prefix == series.prefix
+            and suffix == series.suffix
+            and low <= _semver_key(value) <= high
+        ):
+            members.append(filename)
+    return sorted(members, key=lambda f: _semver_key(_template(f)[2]))
+
+
+def expand_directories(
+    directories: dict[str, list[str]],
+    root: str | Path,
+) -> dict[str, list[str]]:
+    """
+    Expand every range expression in a directories mapping.
+
+    Numeric series expand on their own. Semver series need the filenames
+    they were drawn from, so their directory under ``root`` is listed again;
+    a directory that no longer exists expands them to nothing.
+
+    Args:
+        directories: Mapping of directory paths to file lists, as read back
+            from a collapsed index.
+        root: The directory the index describes.
+
+    Returns:
+        A new mapping with plain filenames only, each list sorted.
+    """
+    expanded = {}
+    for dir_path, files in directories.items():
+        if not any(parse_series(f) is not None for f in files):
+            expanded[dir_path] = files
+            continue
+
+        listing = None
+        names: list[str] = []
+        for entry in files:
+            series = parse_series(entry)
+            if series is None or series.kind == "number":
+                names.extend(expand_series(entry))
+                continue
+            if listing is None:
+                try:
+                    listing = os.listdir(os.path.join(root, dir_path))
+                except OSError:
+                    listing = []
+            names.extend(expand_series(entry, listing))
+        expanded[dir_path] = sorted(names)
+    return expanded
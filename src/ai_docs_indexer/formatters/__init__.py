@@ -1,25 +1,42 @@
 """Output formatters for documentation indexes."""
 
-from .base import Formatter, IndexData
+from .base import Annotation, Formatter, IndexData
+from .dictionary import DictionaryFormatter
 from .json import JsonFormatter
 from .pipe import PipeFormatter
 from .yaml import YamlFormatter
 
 __all__ = [
+    "Annotation",
     "Formatter",
     "IndexData",
     "PipeFormatter",
     "JsonFormatter",
     "YamlFormatter",
+    "DictionaryFormatter",
+    "available_formats",
+    "get_formatter",
 ]
 
+_FORMATTERS: dict[str, type[Formatter]] = {
+    "pipe": PipeFormatter,
+    "json": JsonFormatter,
+    "yaml": YamlFormatter,
+    "dict": DictionaryFormatter,
+}
+
+
+def available_formats() -> list[str]:
+    """Return the names of all registered formats."""
+    return list(_FORMATTERS)
+
 
 def get_formatter(format_name: str) -> Formatter:
     """
     Get a formatter by name.
 
     Args:
-        format_name: The format name (pipe, json, yaml).
+        format_name: The format name (pipe, json, yaml, dict).
 
     Returns:
         A Formatter instance.
@@ -27,14 +44,8 @@ def get_formatter(format_name: str) -> Formatter:
     Raises:
         ValueError: If the format is not supported.
     """
-    formatters = {
-        "pipe": PipeFormatter,
-        "json": JsonFormatter,
-        "yaml": YamlFormatter,
-    }
-
-    if format_name not in formatters:
-        valid = ", ".join(formatters.keys())
+    if format_name not in _FORMATTERS:
+        valid = ", ".join(_FORMATTERS.keys())
         raise ValueError(f"Unknown format '{format_name}'. Valid formats: {valid}")
 
-    return formatters[format_name]()
+    return _FORMATTERS[format_name]()
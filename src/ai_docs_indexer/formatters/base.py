@@ -2,8 +2,28 @@
 
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from typing import NamedTuple
+
+_SIZE_UNITS = "kMGT"
+_ANNOTATION_RE = re.compile(
+    r"(?:~(\d+(?:\.\d)?)([kMGT]?))?(?:#(\d+))?(?:@(\d{4}-\d{2}-\d{2}))?$"
+)
+
+
+class Annotation(NamedTuple):
+    """Hints about one indexed file."""
+
+    size: int | None = None
+    """Size in bytes."""
+
+    lines: int | None = None
+    """Approximate number of lines."""
+
+    modified: str | None = None
+    """Last-modified date (UTC) as YYYY-MM-DD."""
 
 
 @dataclass
@@ -25,6 +45,94 @@ class IndexData:
     metadata: dict[str, str] = field(default_factory=dict)
     """Additional metadata key-value pairs."""
 
+    truncated: str | None = None
+    """Reason the index is partial, or None if it is complete."""
+
+    annotations: dict[str, Annotation] = field(default_factory=dict)
+    """Per-file hints keyed by path relative to the root."""
+
+
+def _compact_size(size: int) -> str:
+    """Render a byte count in 1024-based units, e.g. 512, 4k, 1.5M."""
+    value = float(size)
+    unit = ""
+    for next_unit in _SIZE_UNITS:
+        if value < 1000:
+            break
+        value /= 1024
+        unit = next_unit
+    if unit and value < 10:
+        return f"{value:.1f}".removesuffix(".0") + unit
+    return f"{round(value)}{unit}"
+
+
+def _format_annotation(annotation: Annotation) -> str:
+    """Render an annotation as a compact suffix such as ``~4k#120@2026-10-19``."""
+    parts = []
+    if annotation.size is not None:
+        parts.append(f"~{_compact_size(annotation.size)}")
+    if annotation.lines is not None:
+        parts.append(f"#{annotation.lines}")
+    if annotation.modified is not None:
+        parts.append(f"@{annotation.modified}")
+    return "".join(parts)
+
+
+def _parse_annotation(suffix: str) -> Annotation | None:
+    """
+    Parse a suffix rendered by :func:`_format_annotation`.
+
+    Sizes come back rounded to the precision they were rendered with.
+    Returns None if the text is not an annotation.
+    """
+    match = _ANNOTATION_RE.fullmatch(suffix)
+    if match is None or not suffix:
+        return None
+    number, unit, lines, modified = match.groups()
+    size = None
+    if number is not None:
+        size = round(float(number) * 1024 ** (_SIZE_UNITS.find(unit) + 1 if unit else 0))
+    return Annotation(
+        size=size,
+        lines=int(lines) if lines is not None else None,
+        modified=modified,
+    )
+
+
+def _split_annotation(entry: str) -> tuple[str, Annotation | None]:
+    """Split a trailing annotation suffix off a file entry, if it has one."""
+    match = _ANNOTATION_RE.search(entry)
+    if match is None or match.start() in (0, len(entry)):
+        return entry, None
+    return entry[:match.start()], _parse_annotation(entry[match.start():])
+
+
+def _annotations_to_mapping(annotations: dict[str, Annotation]) -> dict[str, dict]:
+    """Convert annotations to plain dicts for JSON and YAML, omitting unset fields."""
+    return {
+        path: {key: value for key, value in annotation._asdict().items() if value is not None}
+        for path, annotation in annotations.items()
+    }
+
+
+def _from_mapping(output: object, label: str) -> IndexData:
+    """Build IndexData from a decoded JSON or YAML document."""
+    if not isinstance(output, dict) or "directories" not in output:
+        raise ValueError(f"Not a {label} index: missing directories")
+
+    return IndexData(
+        name=output.get("name", ""),
+        root=output.get("root", ""),
+        directories=output["directories"] or {},
+        instruction=output.get("instruction"),
+        metadata=output.get("metadata") or {},
+        truncated=output.get("truncated"),
+        annotations={
+            path: Annotation(**{k: v for k, v in fields.items() if k in Annotation._fields})
+            for path, fields in (output.get("annotations") or {}).items()
+        },
+    )
+
 
 class Formatter(ABC):
     """Abstract base class for output formatters."""
@@ -53,3 +161,19 @@ class Formatter(ABC):
             The formatted string.
         """
         ...
+
+    def parse(self, text: str) -> IndexData:
+        """
+        Parse formatted output back into index data.
+
+        Args:
+            text: A string previously produced by :meth:`format`.
+
+        Returns:
+            The decoded index data.
+
+        Raises:
+            NotImplementedError: If this format cannot be read back.
+            ValueError: If the text is not valid output for this format.
+        """
+        raise NotImplementedError(f"The {self.name} format cannot be parsed")
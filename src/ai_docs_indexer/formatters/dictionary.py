@@ -0,0 +1,259 @@
+"""Dictionary-encoded pipe formatter."""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+
+from .base import Annotation, Formatter, IndexData, _format_annotation, _parse_annotation
+
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+_SPECIAL = frozenset("\\|,{}~^:[]")
+
+
+def _code(index: int) -> str:
+    """Encode a dictionary index in base 36."""
+    if index == 0:
+        return "0"
+    digits = []
+    while index:
+        index, rem = divmod(index, 36)
+        digits.append(_DIGITS[rem])
+    return "".join(reversed(digits))
+
+
+def _escape(text: str) -> str:
+    """Backslash-escape characters that carry meaning in this format."""
+    if not any(c in _SPECIAL or c == "\n" for c in text):
+        return text
+    return "".join(
+        "\\n" if c == "\n" else f"\\{c}" if c in _SPECIAL else c for c in text
+    )
+
+
+def _unescape(text: str) -> str:
+    """Reverse :func:`_escape`."""
+    if "\\" not in text:
+        return text
+    out = []
+    chars = iter(text)
+    for c in chars:
+        if c == "\\":
+            c = next(chars, "")
+            out.append("\n" if c == "n" else c)
+        else:
+            out.append(c)
+    return "".join(out)
+
+
+def _split(text: str, sep: str, maxsplit: int = -1) -> list[str]:
+    """Split on ``sep`` where it is not backslash-escaped."""
+    parts = []
+    start = 0
+    i = 0
+    while i < len(text):
+        c = text[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == sep and maxsplit != 0:
+            parts.append(text[start:i])
+            start = i + 1
+            maxsplit -= 1
+        i += 1
+    parts.append(text[start:])
+    return parts
+
+
+def _select(counts: Counter[str], prefix: str) -> list[str]:
+    """
+    Pick the dictionary entries that shrink the output.
+
+    Candidates are ranked by frequency so the most common entries get the
+    shortest codes, and an entry is kept only when its uses save more bytes
+    than it costs in the header.
+    """
+    entries: list[str] = []
+    for text, count in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+        if count < 2:
+            break
+        size = len(_escape(text))
+        code_size = len(prefix) + len(_code(len(entries)))
+        if count * (size - code_size) > size + 1:
+            entries.append(text)
+    return entries
+
+
+class DictionaryFormatter(Formatter):
+    """
+    Pipe-delimited format with a dictionary of repeated filenames.
+
+    Filenames, stems and extensions that repeat across directories are
+    listed once in the header and referenced by short codes: ``~N`` for a
+    name or stem and ``^N`` for an extension, where ``N`` is a base-36
+    index into the matching dictionary. Literal text is backslash-escaped
+    where it would clash with the syntax, so :meth:`parse` restores the
+    original data exactly, including from ``--compress`` output. File
+    annotations follow the name in unescaped brackets, e.g.
+    ``install^1[~4k#120@2026-10-19]``.
+
+    Example output:
+        [Project Docs Index]|root: ./.docs
+        |~names:README.md,overview
+        |~exts:.md,.mdx
+        |.:{~0}
+        |01-getting-started:{~0,install^1,~1^1}
+        |02-guides:{~0,~1^0}
+    """
+
+    @property
+    def name(self) -> str:
+        return "dict"
+
+    @property
+    def file_extension(self) -> str:
+        return ".md"
+
+    def format(self, data: IndexData) -> str:
+        all_files = [f for files in data.directories.values() for f in files]
+
+        # Whole filenames first, then stems of the remaining files
+        file_counts = Counter(all_files)
+        whole = set(_select(file_counts, "~"))
+        split = {f: os.path.splitext(f) for f in set(all_files) - whole}
+        stem_counts: Counter[str] = Counter()
+        ext_counts: Counter[str] = Counter()
+        for f in all_files:
+            if f in whole:
+                continue
+            stem, ext = split[f]
+            stem_counts[stem] += 1
+            if ext:
+                ext_counts[ext] += 1
+        stems = [s for s in _select(stem_counts, "~") if s not in whole]
+
+        # Re-rank the merged dictionary so the commonest entries get short codes
+        frequency = {name: file_counts[name] for name in whole}
+        frequency.update((s, stem_counts[s]) for s in stems)
+        names = _select(Counter(frequency), "~")
+        name_codes = {text: f"~{_code(i)}" for i, text in enumerate(names)}
+
+        exts = _select(ext_counts, "^")
+        ext_codes = {text: f"^{_code(i)}" for i, text in enumerate(exts)}
+
+        def encode(filename: str) -> str:
+            code = name_codes.get(filename)
+            if code is not None:
+                return code
+            stem, ext = os.path.splitext(filename)
+            stem_part = name_codes.get(stem) or _escape(stem)
+            ext_part = (ext_codes.get(ext) or _escape(ext)) if ext else ""
+            return stem_part + ext_part
+
+        lines: list[str] = [f"[{_escape(data.name)}]|root: {_escape(data.root)}"]
+
+        if data.instruction:
+            lines.append(f"|IMPORTANT: {_escape(data.instruction)}")
+
+        if data.truncated:
+            lines.append(f"|TRUNCATED: {_escape(data.truncated)}")
+
+        for key, value in data.metadata.items():
+            lines.append(f"|{_escape(key)}: {_escape(value)}")
+
+        if names:
+            lines.append("|~names:" + ",".join(_escape(n) for n in names))
+        if exts:
+            lines.append("|~exts:" + ",".join(_escape(e) for e in exts))
+
+        for dir_path, files in sorted(data.directories.items()):
+            tokens = [encode(f) for f in files]
+            if data.annotations:
+                for i, f in enumerate(files):
+                    annotation = data.annotations.get(os.path.join(dir_path, f))
+                    if annotation:
+                        tokens[i] += f"[{_format_annotation(annotation)}]"
+            files_str = ",".join(tokens)
+            label = _escape(dir_path) if dir_path else "."
+            lines.append(f"|{label}:{{{files_str}}}")
+
+        return "\n".join(lines)
+
+    def parse(self, text: str) -> IndexData:
+        segments = _split(text.replace("\n", ""), "|")
+        if len(segments) < 2 or not segments[0].startswith("[") or not segments[0].endswith("]"):
+            raise ValueError("Not a dict-formatted index: missing header")
+        if not segments[1].startswith("root: "):
+            raise ValueError("Not a dict-formatted index: missing root")
+
+        name = _unescape(segments[0][1:-1])
+        root = _unescape(segments[1][len("root: "):])
+        instruction = None
+        truncated = None
+        metadata: dict[str, str] = {}
+        names: list[str] = []
+        exts: list[str] = []
+        directories: dict[str, list[str]] = {}
+        annotations: dict[str, Annotation] = {}
+
+        def decode(token: str) -> str:
+            out = []
+            i = 0
+            while i < len(token):
+                c = token[i]
+                if c == "\\":
+                    out.append(_unescape(token[i:i + 2]))
+                    i += 2
+                elif c in "~^":
+                    j = i + 1
+                    while j < len(token) and token[j] in _DIGITS:
+                        j += 1
+                    table = names if c == "~" else exts
+                    out.append(table[int(token[i + 1:j], 36)])
+                    i = j
+                else:
+                    out.append(c)
+                    i += 1
+            return "".join(out)
+
+        for index, segment in enumerate(segments[2:]):
+            if segment.startswith("~names:"):
+                names = [_unescape(n) for n in _split(segment[len("~names:"):], ",")]
+                continue
+            if segment.startswith("~exts:"):
+                exts = [_unescape(e) for e in _split(segment[len("~exts:"):], ",")]
+                continue
+
+            label, *rest = _split(segment, ":", 1)
+            body = rest[0] if rest else ""
+            if body.startswith("{"):
+                # Escaped braces never start a value, so this is a directory
+                dir_path = "" if label == "." else _unescape(label)
+                inner = body[1:-1]
+                files = []
+                for token in _split(inner, ",") if inner else []:
+                    # Escaped brackets never start an annotation
+                    token, *suffix = _split(token, "[", 1)
+                    filename = decode(token)
+                    if suffix:
+                        annotation = _parse_annotation(suffix[0].removesuffix("]"))
+                        if annotation is not None:
+                            annotations[os.path.join(dir_path, filename)] = annotation
+                    files.append(filename)
+                directories[dir_path] = files
+            elif index == 0 and label == "IMPORTANT":
+                instruction = _unescape(body[1:])
+            elif truncated is None and not metadata and label == "TRUNCATED":
+                truncated = _unescape(body[1:])
+            else:
+                metadata[_unescape(label)] = _unescape(body[1:])
+
+        return IndexData(
+            name=name,
+            root=root,
+            directories=directories,
+            instruction=instruction,
+            metadata=metadata,
+            truncated=truncated,
+            annotations=annotations,
+        )
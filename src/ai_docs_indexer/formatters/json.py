@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 
-from .base import Formatter, IndexData
+from .base import Formatter, IndexData, _annotations_to_mapping, _from_mapping
 
 
 class JsonFormatter(Formatter):
@@ -39,9 +39,23 @@ class JsonFormatter(Formatter):
         if data.instruction:
             output["instruction"] = data.instruction
 
+        if data.truncated:
+            output["truncated"] = data.truncated
+
         if data.metadata:
             output["metadata"] = data.metadata
 
         output["directories"] = data.directories
 
+        if data.annotations:
+            output["annotations"] = _annotations_to_mapping(data.annotations)
+
         return json.dumps(output, indent=2)
+
+    def parse(self, text: str) -> IndexData:
+        try:
+            output = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Not a JSON index: {e}") from e
+        return _from_mapping(output, "JSON")
+
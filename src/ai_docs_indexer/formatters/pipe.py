@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from .base import Formatter, IndexData
+import os
+
+from .base import Annotation, Formatter, IndexData, _format_annotation, _split_annotation
 
 
 class PipeFormatter(Formatter):
@@ -14,6 +16,9 @@ class PipeFormatter(Formatter):
         |IMPORTANT: Prefer retrieval-led reasoning
         |01-getting-started:{01-install.mdx,02-config.mdx}
         |02-guides:{overview.md,advanced.md}
+
+    Files with annotations carry a compact suffix of size, line count and
+    modification date, e.g. ``install.mdx~4k#120@2026-10-19``.
     """
 
     @property
@@ -35,12 +40,22 @@ class PipeFormatter(Formatter):
         if data.instruction:
             lines.append(f"|IMPORTANT: {data.instruction}")
 
+        # Truncation marker if the scan stopped early
+        if data.truncated:
+            lines.append(f"|TRUNCATED: {data.truncated}")
+
         # Metadata lines
         for key, value in data.metadata.items():
             lines.append(f"|{key}: {value}")
 
         # Directory entries
         for dir_path, files in sorted(data.directories.items()):
+            if data.annotations:
+                annotated = []
+                for f in files:
+                    annotation = data.annotations.get(os.path.join(dir_path, f))
+                    annotated.append(f + _format_annotation(annotation) if annotation else f)
+                files = annotated
             files_str = ",".join(files)
             if dir_path:
                 lines.append(f"|{dir_path}:{{{files_str}}}")
@@ -49,3 +64,59 @@ class PipeFormatter(Formatter):
                 lines.append(f"|.:{{{files_str}}}")
 
         return "\n".join(lines)
+
+    def parse(self, text: str) -> IndexData:
+        """
+        Parse pipe output, including ``--compress`` output.
+
+        Pipe output is not escaped, so names containing ``|``, ``,``, ``{``
+        or ``}`` cannot be recovered exactly; use the dict or json format
+        where that matters. Annotation suffixes are split off the file
+        names, with sizes rounded as rendered.
+        """
+        text = text.strip("\n")
+        if "\n" in text:
+            header, *lines = text.split("\n")
+            segments = header.split("|", 1) + [line[1:] for line in lines]
+        else:
+            segments = text.split("|")
+
+        if len(segments) < 2 or not segments[0].startswith("[") or not segments[0].endswith("]"):
+            raise ValueError("Not a pipe-formatted index: missing header")
+        if not segments[1].startswith("root: "):
+            raise ValueError("Not a pipe-formatted index: missing root")
+
+        instruction = None
+        truncated = None
+        metadata: dict[str, str] = {}
+        directories: dict[str, list[str]] = {}
+        annotations: dict[str, Annotation] = {}
+
+        for index, segment in enumerate(segments[2:]):
+            dir_path, sep, files_str = segment.partition(":{")
+            if sep and files_str.endswith("}"):
+                key = "" if dir_path == "." else dir_path
+                files = []
+                for entry in files_str[:-1].split(",") if files_str[:-1] else []:
+                    filename, annotation = _split_annotation(entry)
+                    if annotation is not None:
+                        annotations[os.path.join(key, filename)] = annotation
+                    files.append(filename)
+                directories[key] = files
+            elif index == 0 and segment.startswith("IMPORTANT: "):
+                instruction = segment[len("IMPORTANT: "):]
+            elif truncated is None and not metadata and segment.startswith("TRUNCATED: "):
+                truncated = segment[len("TRUNCATED: "):]
+            else:
+                key, _, value = segment.partition(": ")
+                metadata[key] = value
+
+        return IndexData(
+            name=segments[0][1:-1],
+            root=segments[1][len("root: "):],
+            directories=directories,
+            instruction=instruction,
+            metadata=metadata,
+            truncated=truncated,
+            annotations=annotations,
+        )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import yaml
 
-from .base import Formatter, IndexData
+from .base import Formatter, IndexData, _annotations_to_mapping, _from_mapping
 
 
 class YamlFormatter(Formatter):
@@ -38,14 +38,27 @@ class YamlFormatter(Formatter):
         if data.instruction:
             output["instruction"] = data.instruction
 
+        if data.truncated:
+            output["truncated"] = data.truncated
+
         if data.metadata:
             output["metadata"] = data.metadata
 
         output["directories"] = data.directories
 
+        if data.annotations:
+            output["annotations"] = _annotations_to_mapping(data.annotations)
+
         return yaml.dump(
             output,
             default_flow_style=False,
             sort_keys=False,
             allow_unicode=True,
         )
+
+    def parse(self, text: str) -> IndexData:
+        try:
+            output = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Not a YAML index: {e}") from e
+        return _from_mapping(output, "YAML")
@@ -0,0 +1,248 @@
+"""Cross-document link graph extraction."""
+
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import unquote
+
+from .cache import FileCache
+from .scanner import ScanResult
+
+# Fenced code blocks are skipped so example links are not counted
+_FENCE_RE = re.compile(r"^(`{3,}|~{3,}).*?^\1", re.MULTILINE | re.DOTALL)
+# [text](target "title") and ![alt](target)
+_INLINE_RE = re.compile(r"\]\(\s*<?([^)\s>]+)>?(?:\s+[\"'(][^)]*)?\)")
+# [ref]: target
+_REFERENCE_RE = re.compile(r"^ {0,3}\[[^\]]+\]:\s*<?(\S+?)>?(?:\s|$)", re.MULTILINE)
+# <a href="target"> and JSX equivalents in MDX
+_HREF_RE = re.compile(r"\bhref=[\"']([^\"']+)[\"']")
+_SCHEME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*:")
+
+
+class LinkGraph(NamedTuple):
+    """Relative links between the files of a scan."""
+
+    edges: dict[str, list[str]]
+    """Mapping of each linking file to the indexed files it links to."""
+
+    in_degree: dict[str, int]
+    """Number of distinct files linking to each indexed file."""
+
+    broken: dict[str, list[str]]
+    """Mapping of each linking file to link targets that do not exist."""
+
+
+def parse_link_targets(text: str) -> list[str]:
+    """
+    Extract raw link targets from Markdown or MDX source.
+
+    Args:
+        text: The document source.
+
+    Returns:
+        Link targets in document order, as written.
+    """
+    text = _FENCE_RE.sub("", text)
+    targets = []
+    for pattern in (_INLINE_RE, _REFERENCE_RE, _HREF_RE):
+        targets.extend(match.group(1) for match in pattern.finditer(text))
+    return targets
+
+
+def _read_targets(full_path: str) -> list[str]:
+    with open(full_path, encoding="utf-8", errors="replace") as f:
+        return parse_link_targets(f.read())
+
+
+def extract_links(
+    result: ScanResult,
+    extensions: tuple[str, ...] = (".md", ".mdx"),
+    cache_path: str | Path | None = None,
+    workers: int | None = None,
+) -> LinkGraph:
+    """
+    Build the graph of relative links between scanned documents.
+
+    Files are parsed in parallel, and parsed targets are cached per file by
+    size and mtime in ``cache_path`` so later runs only reparse changed
+    documents. Targets are resolved against the indexed files, trying the
+    bare path, then each extension, then ``index`` and ``README`` pages.
+    External URLs, pure anchors, and existing non-document files (such as
+    images) are ignored.
+
+    Args:
+        result: The scan whose files should be linked.
+        extensions: Extensions to try for extensionless link targets.
+        cache_path: Optional JSON cache file for parsed targets.
+        workers: Maximum parser threads (default: ThreadPoolExecutor's).
+
+    Returns:
+        LinkGraph with edges, in-degrees and broken links.
+    """
+    root = result.root_path
+    files = [
+        os.path.join(dir_path, filename) if dir_path else filename
+        for dir_path, filenames in result.directories.items()
+        for filename in filenames
+    ]
+    known = set(files)
+    cache = FileCache(cache_path)
+
+    def load(rel_path: str) -> tuple[str, os.stat_result | None, list[str] | None, bool]:
+        full_path = os.path.join(root, rel_path)
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            return rel_path, None, None, False
+        targets = cache.get(rel_path, st)
+        if targets is not None:
+            return rel_path, st, targets, False
+        try:
+            return rel_path, st, _read_targets(full_path), True
+        except OSError:
+            return rel_path, st, None, False
+
+    edges: dict[str, list[str]] = {}
+    broken: dict[str, list[str]] = {}
+    in_degree = dict.fromkeys(files, 0)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        loaded = list(pool.map(load, files))
+
+    for rel_path, st, targets, fresh in loaded:
+        if targets is None:
+            continue
+        if fresh:
+            cache.set(rel_path, st, targets)
+
+        source_dir = os.path.dirname(rel_path)
+        linked: set[str] = set()
+        missing: list[str] = []
+        for target in targets:
+            resolved = _resolve(root, source_dir, target, known, extensions)
+            if resolved is False:
+                missing.append(target)
+            elif resolved is not None and resolved != rel_path:
+                linked.add(resolved)
+
+        if linked:
+            edges[rel_path] = sorted(linked)
+            for target in linked:
+                in_degree[target] += 1
+        if missing:
+            broken[rel_path] = missing
+
+    cache.save()
+    return LinkGraph(edges=edges, in_degree=in_degree, broken=broken)
+
+
+def _resolve(
+    root: Path,
+    source_dir: str,
+    target: str,
+    known: set[str],
+    extensions: tuple[str, ...],
+) -> str | None | bool:
+    """
+    Resolve a link target to an indexed file.
+
+    Returns the indexed relative path, None for links that are not between
+    documents, or False for a broken link.
+    """
+    if _SCHEME_RE.match(target) or target.startswith("//"):
+        return None
+    path = unquote(target.split("#", 1)[0].split("?", 1)[0])
+    if not path:
+        return None
+
+    if path.startswith("/"):
+        path = os.path.normpath(path.lstrip("/"))
+    else:
+        path = os.path.normpath(os.path.join(source_dir, path))
+    if path == ".." or path.startswith("../"):
+        return None
+
+    candidates = [path]
+    candidates.extend(path + ext for ext in extensions)
+    for page in ("index", "README"):
+        candidates.extend(os.path.join(path, page + ext) for ext in extensions)
+    for candidate in candidates:
+        if candidate in known:
+            return candidate
+
+    if os.path.exists(os.path.join(root, path)):
+        return None
+    return False
+
+
+def rank_by_links(
+    directories: dict[str, list[str]],
+    graph: LinkGraph,
+) -> dict[str, list[str]]:
+    """
+    Order each directory's files by inbound links, most linked first.
+
+    Files with equal in-degree keep their existing order.
+
+    Args:
+        directories: Mapping of directory paths to file lists.
+        graph: Link graph for the same files.
+
+    Returns:
+        A new mapping with re-ordered file lists.
+    """
+    ranked = {}
+    for dir_path, files in directories.items():
+        ranked[dir_path] = sorted(
+            files,
+            key=lambda f: -graph.in_degree.get(
+                os.path.join(dir_path, f) if dir_path else f, 0
+            ),
+        )
+    return ranked
+
+
+def select_by_links(
+    directories: dict[str, list[str]],
+    graph: LinkGraph,
+    max_files: int,
+) -> dict[str, list[str]]:
+    """
+    Keep the ``max_files`` most linked files across all directories.
+
+    Files with equal in-degree are kept in their existing order, so with no
+    links this is the same cut a budgeted walk makes. Directories left
+    without files are dropped.
+
+    Args:
+        directories: Mapping of directory paths to file lists.
+        graph: Link graph for the same files.
+        max_files: Number of files to keep.
+
+    Returns:
+        A new mapping with at most ``max_files`` files.
+    """
+    files = [
+        (dir_path, filename)
+        for dir_path, filenames in directories.items()
+        for filename in filenames
+    ]
+    if len(files) <= max_files:
+        return directories
+
+    ranked = sorted(
+        range(len(files)),
+        key=lambda i: -graph.in_degree.get(
+            os.path.join(files[i][0], files[i][1]) if files[i][0] else files[i][1], 0
+        ),
+    )
+    keep = set(ranked[:max_files])
+    selected: dict[str, list[str]] = {}
+    for index, (dir_path, filename) in enumerate(files):
+        if index in keep:
+            selected.setdefault(dir_path, []).append(filename)
+    return selected
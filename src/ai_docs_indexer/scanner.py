@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import mmap
 import os
+import sys
+import time
+from collections import defaultdict
 from pathlib import Path
-from typing import NamedTuple
+from typing import Callable, Iterable, NamedTuple
 
 
 class ScanResult(NamedTuple):
@@ -19,21 +23,345 @@ class ScanResult(NamedTuple):
     root_path: Path
     """The root path that was scanned."""
 
+    skipped: tuple[str, ...] = ()
+    """Relative paths skipped as already-visited directories or duplicate files.
+
+    Directories carry a trailing slash.
+    """
+
+    truncated: str | None = None
+    """Why the scan stopped early, or None if the result is complete."""
+
+    file_stats: dict[str, os.stat_result] | None = None
+    """Stat data of each listed file, keyed by relative path.
+
+    Only collected when scanning with ``stat_files=True``.
+    """
+
+
+def _file_id(path: str | Path) -> tuple[int, int] | None:
+    """Return the (st_dev, st_ino) identity of a path, following symlinks."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _entry_id(entry: os.DirEntry) -> tuple[int, int] | None:
+    """Return the (st_dev, st_ino) identity of a directory entry, following symlinks."""
+    try:
+        st = entry.stat()
+    except OSError:
+        return None
+    if not st.st_ino:
+        # DirEntry.stat() leaves st_ino zero on Windows
+        return _file_id(entry.path)
+    return (st.st_dev, st.st_ino)
+
+
+# Manifest bytes parsed per slice; large enough to amortise the Python loop
+_MANIFEST_CHUNK = 1 << 20
+
+
+def _resolve_root(path: str | Path) -> Path:
+    """Resolve a scan root, checking that it is an existing directory."""
+    root = Path(path).resolve()
+
+    if not root.exists():
+        raise ValueError(f"Path does not exist: {root}")
+    if not root.is_dir():
+        raise ValueError(f"Path is not a directory: {root}")
+
+    return root
+
+
+def _match_files(
+    filenames: Iterable[str],
+    extensions: tuple[str, ...],
+    include_hidden: bool,
+) -> list[str]:
+    """Return the sorted filenames that pass the extension and hidden filters."""
+    matching_files = []
+    for filename in sorted(filenames):
+        # Skip hidden files unless included
+        if not include_hidden and filename.startswith("."):
+            continue
+
+        # Check extension
+        if any(filename.endswith(ext) for ext in extensions):
+            matching_files.append(filename)
+
+    return matching_files
+
+
+def _walk_key(dir_key: str) -> tuple[str, ...]:
+    """Sort key that reproduces the order in which scan_directory visits directories."""
+    return tuple(dir_key.split(os.sep)) if dir_key else ()
+
+
+class _ScanState:
+    """
+    Filtering, dedupe and budget bookkeeping for one directory walk.
+
+    Both :func:`scan_directory` and the asyncio scanner feed each listed
+    directory through :meth:`visit`, so they apply identical rules and only
+    differ in how directories are listed.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        extensions: tuple[str, ...],
+        include_hidden: bool,
+        follow_symlinks: bool,
+        dedupe_files: bool,
+        max_depth: int | None,
+        max_files: int | None,
+        max_dirs: int | None,
+        timeout: float | None,
+        stat_files: bool = False,
+    ):
+        self.root = root
+        self.extensions = extensions
+        self.include_hidden = include_hidden
+        self.follow_symlinks = follow_symlinks
+        self.dedupe_files = dedupe_files
+        self.max_depth = max_depth
+        self.max_files = max_files
+        self.max_dirs = max_dirs
+        self.timeout = timeout
+        self.stat_files = stat_files
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+
+        self.directories: dict[str, list[str]] = {}
+        self.file_stats: dict[str, os.stat_result] = {}
+        self.total_files = 0
+        self.seen_dirs: set[tuple[int, int]] = set()
+        self.seen_files: set[tuple[int, int]] = set()
+        self.skipped: list[str] = []
+        self.truncated: str | None = None
+        self.stopped = False
+        self.dirs_visited = 0
+
+    def expire(self) -> None:
+        """Stop the walk because the timeout was reached."""
+        self.truncated = f"timeout ({self.timeout:g}s) reached"
+        self.stopped = True
+
+    def visit(
+        self,
+        rel_dir: Path,
+        dirnames: list[str],
+        filenames: list[str],
+        dir_id: tuple[int, int] | None,
+        file_id: Callable[[str], tuple[int, int] | None],
+        file_stats: dict[str, os.stat_result] | None = None,
+    ) -> list[str]:
+        """
+        Process one listed directory.
+
+        Args:
+            rel_dir: The directory relative to the root.
+            dirnames: Subdirectory names; pruned and sorted in place to the
+                ones the walk should descend into, in order.
+            filenames: Names of the directory's other entries.
+            dir_id: (st_dev, st_ino) of the directory, needed only when
+                following symlinks.
+            file_id: Returns the (st_dev, st_ino) of a file by name, used
+                only when deduping files.
+            file_stats: Stat data of the directory's files by name, kept
+                for the listed files when ``stat_files`` is set.
+
+        Returns:
+            The files listed for this directory (possibly empty). After a
+            budget is exhausted ``stopped`` is set and the walk must end.
+        """
+        # Stop before visiting a directory that would exceed the budget
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            self.expire()
+            return []
+        if self.max_dirs is not None and self.dirs_visited >= self.max_dirs:
+            self.truncated = f"max dirs ({self.max_dirs}) reached"
+            self.stopped = True
+            return []
+        self.dirs_visited += 1
+
+        # Prune directories already reached through another symlink
+        if self.follow_symlinks and dir_id is not None:
+            if dir_id in self.seen_dirs:
+                dirnames[:] = []
+                self.skipped.append(f"{rel_dir}/")
+                return []
+            self.seen_dirs.add(dir_id)
+
+        # Filter hidden directories if needed, keeping walk order stable
+        if not self.include_hidden:
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        else:
+            dirnames.sort()
+
+        # Prune subdirectories below the depth limit
+        if self.max_depth is not None and len(rel_dir.parts) >= self.max_depth and dirnames:
+            dirnames[:] = []
+            self.truncated = self.truncated or f"max depth ({self.max_depth}) reached"
+
+        # Filter and collect matching files
+        matching_files = []
+        for filename in _match_files(filenames, self.extensions, self.include_hidden):
+            # Skip files already listed under another name
+            if self.dedupe_files:
+                identity = file_id(filename)
+                if identity is not None:
+                    if identity in self.seen_files:
+                        self.skipped.append(str(rel_dir / filename))
+                        continue
+                    self.seen_files.add(identity)
+
+            matching_files.append(filename)
+
+        # Keep only as many files as the budget allows
+        limit_hit = (
+            self.max_files is not None
+            and self.total_files + len(matching_files) > self.max_files
+        )
+        if limit_hit:
+            matching_files = matching_files[:self.max_files - self.total_files]
+
+        # Only add directories that have matching files
+        if matching_files:
+            dir_key = str(rel_dir) if str(rel_dir) != "." else ""
+            self.directories[dir_key] = matching_files
+            self.total_files += len(matching_files)
+
+            if self.stat_files and file_stats:
+                for filename in matching_files:
+                    st = file_stats.get(filename)
+                    if st is not None:
+                        self.file_stats[os.path.join(dir_key, filename)] = st
+
+        if limit_hit:
+            self.truncated = f"max files ({self.max_files}) reached"
+            self.stopped = True
+
+        return matching_files
+
+    def result(self) -> ScanResult:
+        """Build the ScanResult for everything visited so far."""
+        return ScanResult(
+            directories=self.directories,
+            total_files=self.total_files,
+            root_path=self.root,
+            skipped=tuple(self.skipped),
+            truncated=self.truncated,
+            file_stats=self.file_stats if self.stat_files else None,
+        )
+
+
+class _Listing(NamedTuple):
+    """One directory listing, with any stat data the scan needs."""
+
+    dirnames: list[str]
+    filenames: list[str]
+    symlinks: set[str]
+    dir_id: tuple[int, int] | None
+    file_ids: dict[str, tuple[int, int] | None]
+    file_stats: dict[str, os.stat_result]
+
+
+def _list_directory(dirpath: str, state: _ScanState) -> _Listing | None:
+    """
+    List a directory the way os.walk does, keeping its DirEntry stat data.
+
+    File identities and stats are taken from ``DirEntry.stat()``, which is
+    free on Windows and one cached stat per matching file elsewhere, so a
+    file is never stat'ed twice.
+    """
+    dirnames: list[str] = []
+    filenames: list[str] = []
+    symlinks: set[str] = set()
+    entries: dict[str, os.DirEntry] = {}
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dirnames.append(entry.name)
+                    if entry.is_symlink():
+                        symlinks.add(entry.name)
+                else:
+                    filenames.append(entry.name)
+                    entries[entry.name] = entry
+    except OSError:
+        # os.walk skips directories it cannot list
+        return None
+
+    file_ids = {}
+    file_stats = {}
+    if state.dedupe_files or state.stat_files:
+        for filename in _match_files(filenames, state.extensions, state.include_hidden):
+            entry = entries[filename]
+            if state.dedupe_files:
+                file_ids[filename] = _entry_id(entry)
+            if state.stat_files:
+                try:
+                    file_stats[filename] = entry.stat()
+                except OSError:
+                    # A dangling symlink is still listed; describe the link itself
+                    try:
+                        file_stats[filename] = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        pass
+
+    return _Listing(
+        dirnames,
+        filenames,
+        symlinks,
+        _file_id(dirpath) if state.follow_symlinks else None,
+        file_ids,
+        file_stats,
+    )
+
 
 def scan_directory(
     path: str | Path,
     extensions: tuple[str, ...] = (".md", ".mdx"),
     include_hidden: bool = False,
     follow_symlinks: bool = False,
+    dedupe_files: bool = False,
+    max_depth: int | None = None,
+    max_files: int | None = None,
+    max_dirs: int | None = None,
+    timeout: float | None = None,
+    stat_files: bool = False,
 ) -> ScanResult:
     """
     Recursively scan a directory for documentation files.
 
+    The optional limits are enforced during the walk. When one trips, the
+    walk stops (or, for ``max_depth``, prunes) and the partial result is
+    returned with ``truncated`` set to the reason.
+
     Args:
         path: The directory path to scan.
         extensions: File extensions to include (with leading dot).
         include_hidden: Whether to include hidden files/directories.
-        follow_symlinks: Whether to follow symbolic links.
+        follow_symlinks: Whether to follow symbolic links. Directories are
+            tracked by inode, so symlink cycles and repeated symlinked
+            subtrees are walked only once.
+        dedupe_files: Whether to list hard-linked or symlinked copies of the
+            same file only once (first occurrence in sorted walk order wins).
+        max_depth: Deepest directory level to descend into (0 scans only
+            the root directory itself).
+        max_files: Maximum number of files to list.
+        max_dirs: Maximum number of directories to visit.
+        timeout: Maximum wall-clock seconds to spend walking.
+        stat_files: Whether to record each listed file's stat data in
+            ``file_stats``. The walk then lists directories with
+            ``os.scandir`` itself so the stats come from the listing.
 
     Returns:
         ScanResult with directories mapping and metadata.
@@ -41,47 +369,287 @@ def scan_directory(
     Raises:
         ValueError: If path doesn't exist or isn't a directory.
     """
-    root = Path(path).resolve()
-
-    if not root.exists():
-        raise ValueError(f"Path does not exist: {root}")
-    if not root.is_dir():
-        raise ValueError(f"Path is not a directory: {root}")
+    root = _resolve_root(path)
+    state = _ScanState(
+        root,
+        extensions,
+        include_hidden,
+        follow_symlinks,
+        dedupe_files,
+        max_depth,
+        max_files,
+        max_dirs,
+        timeout,
+        stat_files,
+    )
 
-    directories: dict[str, list[str]] = {}
-    total_files = 0
+    if stat_files:
+        stack = [str(root)]
+        while stack and not state.stopped:
+            dirpath = stack.pop()
+            listing = _list_directory(dirpath, state)
+            if listing is None:
+                continue
+            state.visit(
+                Path(dirpath).relative_to(root),
+                listing.dirnames,
+                listing.filenames,
+                listing.dir_id,
+                listing.file_ids.get,
+                listing.file_stats,
+            )
+            # Push children in reverse so they pop in sorted order
+            for dirname in reversed(listing.dirnames):
+                if follow_symlinks or dirname not in listing.symlinks:
+                    stack.append(os.path.join(dirpath, dirname))
+        return state.result()
 
     for dirpath, dirnames, filenames in os.walk(
         root, followlinks=follow_symlinks
     ):
-        current = Path(dirpath)
-        rel_dir = current.relative_to(root)
+        state.visit(
+            Path(dirpath).relative_to(root),
+            dirnames,
+            filenames,
+            _file_id(dirpath) if follow_symlinks else None,
+            lambda name: _file_id(os.path.join(dirpath, name)),
+        )
+        if state.stopped:
+            break
 
-        # Filter hidden directories if needed
-        if not include_hidden:
-            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+    return state.result()
 
-        # Filter and collect matching files
-        matching_files = []
-        for filename in sorted(filenames):
-            # Skip hidden files unless included
-            if not include_hidden and filename.startswith("."):
-                continue
 
-            # Check extension
-            if any(filename.endswith(ext) for ext in extensions):
-                matching_files.append(filename)
+def rescan_paths(
+    path: str | Path,
+    previous: dict[str, list[str]],
+    changed: Iterable[str | Path],
+    extensions: tuple[str, ...] = (".md", ".mdx"),
+    include_hidden: bool = False,
+    follow_symlinks: bool = False,
+) -> ScanResult:
+    """
+    Update a previous scan using only the paths known to have changed.
 
-        # Only add directories that have matching files
+    Each changed file causes its parent directory to be listed again; a
+    changed path that is an existing directory has its subtree rescanned,
+    and a path that no longer exists drops its entries. All other entries of
+    ``previous`` are kept as they are, so the result matches a full
+    :func:`scan_directory` only if every change is reported.
+
+    Args:
+        path: The directory that was originally scanned.
+        previous: Directories mapping from the earlier scan.
+        changed: Changed paths, absolute or relative to the current directory
+            (e.g. the output of ``git diff --name-only``). Paths outside
+            ``path`` are ignored.
+        extensions: File extensions to include (with leading dot).
+        include_hidden: Whether to include hidden files/directories.
+        follow_symlinks: Whether to follow symbolic links.
+
+    Returns:
+        ScanResult with the updated directories mapping.
+
+    Raises:
+        ValueError: If path doesn't exist or isn't a directory.
+    """
+    root = _resolve_root(path)
+    root_str = str(root)
+    directories = dict(previous)
+
+    # Relative directory key for each parent path as given (None if outside root)
+    parents: dict[str, str | None] = {}
+    drop: set[str] = set()
+    rescan: set[str] = set()
+    relist: set[str] = set()
+
+    for changed_path in changed:
+        # Resolve the parent only, so a changed symlink is not followed away
+        parent, name = os.path.split(os.path.abspath(changed_path))
+        if parent not in parents:
+            real = os.path.realpath(parent)
+            if real == root_str:
+                parents[parent] = ""
+            elif real.startswith(root_str + os.sep):
+                parents[parent] = real[len(root_str) + 1:]
+            else:
+                parents[parent] = None
+        rel_parent = parents[parent]
+
+        if rel_parent is None:
+            # Only the root itself may sit outside its own parent
+            if os.path.realpath(os.path.join(parent, name)) == root_str:
+                drop.add("")
+                rescan.add("")
+            continue
+
+        dir_key = os.path.join(rel_parent, name) if rel_parent else name
+        full = os.path.join(root_str, dir_key)
+        if os.path.isdir(full) and (follow_symlinks or not os.path.islink(full)):
+            drop.add(dir_key)
+            rescan.add(dir_key)
+            continue
+
+        if dir_key in directories or not os.path.lexists(full):
+            # A deleted directory takes its whole subtree with it
+            drop.add(dir_key)
+        relist.add(rel_parent)
+
+    reachable_cache: dict[str, bool] = {"": True}
+
+    def reachable(dir_key: str) -> bool:
+        # Mirror the walk: hidden directories are pruned, and symlinked
+        # directories are only entered when following links.
+        if dir_key not in reachable_cache:
+            parent, name = os.path.split(dir_key)
+            full = os.path.join(root_str, dir_key)
+            reachable_cache[dir_key] = (
+                reachable(parent)
+                and (include_hidden or not name.startswith("."))
+                and (follow_symlinks or not os.path.islink(full))
+                and os.path.isdir(full)
+            )
+        return reachable_cache[dir_key]
+
+    for dir_key in relist:
+        if not reachable(dir_key):
+            drop.add(dir_key)
+
+    def dropped(dir_key: str) -> bool:
+        while dir_key not in drop:
+            if not dir_key:
+                return False
+            dir_key = os.path.dirname(dir_key)
+        return True
+
+    if drop:
+        directories = {k: v for k, v in directories.items() if not dropped(k)}
+
+    for dir_key in rescan:
+        if not reachable(dir_key):
+            continue
+        sub = scan_directory(
+            os.path.join(root_str, dir_key),
+            extensions=extensions,
+            include_hidden=include_hidden,
+            follow_symlinks=follow_symlinks,
+        )
+        for sub_key, files in sub.directories.items():
+            directories[os.path.join(dir_key, sub_key) if sub_key else dir_key] = files
+
+    for dir_key in relist:
+        if not reachable(dir_key):
+            continue
+        directories.pop(dir_key, None)
+        with os.scandir(os.path.join(root_str, dir_key)) as entries:
+            filenames = [entry.name for entry in entries if not entry.is_dir()]
+        matching_files = _match_files(filenames, extensions, include_hidden)
         if matching_files:
-            dir_key = str(rel_dir) if str(rel_dir) != "." else ""
             directories[dir_key] = matching_files
-            total_files += len(matching_files)
+
+    ordered = {key: directories[key] for key in sorted(directories, key=_walk_key)}
+
+    return ScanResult(
+        directories=ordered,
+        total_files=sum(len(files) for files in ordered.values()),
+        root_path=root,
+    )
+
+
+def scan_manifest(
+    manifest: str | Path,
+    path: str | Path,
+    extensions: tuple[str, ...] = (".md", ".mdx"),
+    include_hidden: bool = False,
+    max_depth: int | None = None,
+    max_files: int | None = None,
+) -> ScanResult:
+    """
+    Build a scan result from a prebuilt list of file paths.
+
+    The manifest is a NUL-separated (``find PATH -type f -print0``) or
+    newline-separated list of file paths, either absolute or relative to
+    ``path`` (a leading ``./`` is ignored). It is memory-mapped and split
+    in large chunks, and the same extension and hidden filters as
+    :func:`scan_directory` are applied; the scanned tree itself is never
+    touched. Entries outside ``path`` are ignored.
+
+    ``max_depth`` and ``max_files`` are applied in walk order as in
+    :func:`scan_directory`. Depth truncation is reported only when a
+    matching file lies below the limit, since the manifest does not list
+    directories.
+
+    Args:
+        manifest: Path to the manifest file.
+        path: The directory the manifest describes.
+        extensions: File extensions to include (with leading dot).
+        include_hidden: Whether to include hidden files/directories.
+        max_depth: Deepest directory level to include files from.
+        max_files: Maximum number of files to list.
+
+    Returns:
+        ScanResult with directories mapping and metadata.
+    """
+    root = Path(os.path.abspath(path))
+    prefix = str(root).rstrip("/") + "/"
+    encoding = sys.getfilesystemencoding()
+    found: defaultdict[str, list[str]] = defaultdict(list)
+
+    def add_chunk(chunk: str, sep: str) -> None:
+        # Normalise "./x" and "<root>/x" entries to "x" with two bulk
+        # replaces; anything still absolute afterwards lies outside the root.
+        chunk = (sep + chunk).replace(sep + prefix, sep)
+        while sep + "./" in chunk:
+            chunk = chunk.replace(sep + "./", sep)
+
+        for entry in chunk.split(sep):
+            if not entry.endswith(extensions) or entry.startswith(("/", "../")):
+                continue
+            # A hidden file or any hidden parent shows up as "/." or a leading "."
+            if not include_hidden and (entry.startswith(".") or "/." in entry):
+                continue
+            dir_key, _, name = entry.rpartition("/")
+            found[dir_key].append(name)
+
+    with open(manifest, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                sep = b"\0" if mm.find(b"\0") != -1 else b"\n"
+                pos = 0
+                end = len(mm)
+                while pos < end:
+                    # Split a chunk at its last separator; the tail carries over
+                    cut = mm.rfind(sep, pos, min(pos + _MANIFEST_CHUNK, end))
+                    cut = end if cut == -1 or pos + _MANIFEST_CHUNK >= end else cut
+                    chunk = mm[pos:cut].decode(encoding, "surrogateescape")
+                    if sep == b"\n":
+                        chunk = chunk.replace("\r", "")
+                    add_chunk(chunk, sep.decode())
+                    pos = cut + 1
+
+    directories: dict[str, list[str]] = {}
+    total_files = 0
+    truncated = None
+    for dir_key in sorted(found, key=_walk_key):
+        if max_depth is not None and len(_walk_key(dir_key)) > max_depth:
+            truncated = truncated or f"max depth ({max_depth}) reached"
+            continue
+        files = sorted(set(found[dir_key]))
+        limit_hit = max_files is not None and total_files + len(files) > max_files
+        if limit_hit:
+            files = files[:max_files - total_files]
+        if files:
+            directories[dir_key] = files
+            total_files += len(files)
+        if limit_hit:
+            truncated = f"max files ({max_files}) reached"
+            break
 
     return ScanResult(
         directories=directories,
         total_files=total_files,
         root_path=root,
+        truncated=truncated,
     )
 
 
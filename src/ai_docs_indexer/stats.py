@@ -0,0 +1,158 @@
+"""Size analytics for documentation indexes."""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Iterable, NamedTuple
+
+from .formatters import IndexData, get_formatter
+
+# Words, digit runs and single punctuation characters, roughly how BPE
+# tokenizers split path-like text.
+_TOKEN_RE = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+
+
+class FormatSize(NamedTuple):
+    """Rendered size of one output format."""
+
+    bytes: int
+    """UTF-8 encoded size of the rendered index."""
+
+    tokens: int
+    """Approximate token count of the rendered index."""
+
+
+class DirectoryStats(NamedTuple):
+    """Contribution of one directory to the pipe-formatted index."""
+
+    path: str
+    """Relative directory path ("" for the scanned root)."""
+
+    files: int
+    """Number of files listed directly in this directory."""
+
+    bytes: int
+    """Bytes of this directory's own index entry."""
+
+    tokens: int
+    """Approximate tokens of this directory's own index entry."""
+
+    subtree_files: int
+    """Number of files listed in this directory and its descendants."""
+
+    subtree_bytes: int
+    """Bytes of the entries for this directory and its descendants."""
+
+    subtree_tokens: int
+    """Approximate tokens of the entries for this directory and its descendants."""
+
+
+class IndexStats(NamedTuple):
+    """Size breakdown of a documentation index."""
+
+    formats: dict[str, FormatSize]
+    """Rendered size of each requested output format."""
+
+    directories: dict[str, DirectoryStats]
+    """Per-directory contributions, including directories with no own files."""
+
+    name_counts: Counter[str]
+    """How often each filename occurs across all directories."""
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens in a piece of text.
+
+    This is an offline heuristic: letter runs count as one token per four
+    characters, digit runs as one per three, and every other non-space
+    character as one token.
+
+    Args:
+        text: The text to measure.
+
+    Returns:
+        The approximate token count.
+    """
+    count = 0
+    for match in _TOKEN_RE.finditer(text):
+        run = match.group()
+        if run[0].isdigit():
+            count += (len(run) + 2) // 3
+        elif run[0].isalpha():
+            count += (len(run) + 3) // 4
+        else:
+            count += 1
+    return count
+
+
+def compute_stats(data: IndexData, formats: Iterable[str] = ("pipe",)) -> IndexStats:
+    """
+    Compute size analytics for an index.
+
+    Each format is rendered once to measure its total size. Directory
+    contributions are derived arithmetically from the pipe entry layout
+    (``|dir:{a,b}``) in a single pass over ``data.directories``.
+
+    Args:
+        data: The index data to measure.
+        formats: Output format names to render and measure.
+
+    Returns:
+        IndexStats with per-format and per-directory breakdowns.
+    """
+    format_sizes: dict[str, FormatSize] = {}
+    for format_name in formats:
+        rendered = get_formatter(format_name).format(data)
+        format_sizes[format_name] = FormatSize(
+            bytes=len(rendered.encode("utf-8")),
+            tokens=estimate_tokens(rendered),
+        )
+
+    name_counts: Counter[str] = Counter()
+    name_sizes: dict[str, tuple[int, int]] = {}
+    own: dict[str, tuple[int, int, int]] = {}
+    subtree: dict[str, list[int]] = {}
+
+    for dir_path, files in data.directories.items():
+        label = dir_path or "."
+        # "|" + label + ":{" + files joined by "," + "}" + newline
+        entry_bytes = len(label.encode("utf-8")) + 5 + max(len(files) - 1, 0)
+        entry_tokens = estimate_tokens(label) + 4 + max(len(files) - 1, 0)
+        for filename in files:
+            name_counts[filename] += 1
+            size = name_sizes.get(filename)
+            if size is None:
+                size = (len(filename.encode("utf-8")), estimate_tokens(filename))
+                name_sizes[filename] = size
+            entry_bytes += size[0]
+            entry_tokens += size[1]
+
+        own[dir_path] = (len(files), entry_bytes, entry_tokens)
+
+        # Roll the entry up into the directory and all of its ancestors
+        ancestor = dir_path
+        while True:
+            totals = subtree.setdefault(ancestor, [0, 0, 0])
+            totals[0] += len(files)
+            totals[1] += entry_bytes
+            totals[2] += entry_tokens
+            if not ancestor:
+                break
+            ancestor = ancestor.rpartition("/")[0]
+
+    directories = {
+        path: DirectoryStats(
+            path,
+            *own.get(path, (0, 0, 0)),
+            *totals,
+        )
+        for path, totals in sorted(subtree.items())
+    }
+
+    return IndexStats(
+        formats=format_sizes,
+        directories=directories,
+        name_counts=name_counts,
+    )
@@ -0,0 +1,146 @@
+"""Tests for the aio module."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from ai_docs_indexer import aio
+from ai_docs_indexer.aio import (
+    format_async,
+    get_executor,
+    iter_directory,
+    scan_directory_async,
+)
+from ai_docs_indexer.formatters import IndexData, get_formatter
+from ai_docs_indexer.scanner import scan_directory
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+async def collect(path, **options):
+    """Gather everything iter_directory yields."""
+    return [entry async for entry in iter_directory(path, **options)]
+
+
+@pytest.fixture
+def slow_listing(monkeypatch):
+    """Make every directory listing take 50ms."""
+    list_directory = aio._list_directory
+
+    def slow(dirpath, state):
+        time.sleep(0.05)
+        return list_directory(dirpath, state)
+
+    monkeypatch.setattr(aio, "_list_directory", slow)
+
+
+class TestScanDirectoryAsync:
+    """Tests for scan_directory_async function."""
+
+    def test_matches_sync_scan(self):
+        """Test that the async scan returns the same result as scan_directory."""
+        path = FIXTURES_DIR / "sample-docs"
+        result = asyncio.run(scan_directory_async(path))
+
+        assert result == scan_directory(path)
+
+    def test_budgets(self, tmp_path):
+        """Test that scan budgets truncate as in the sync scan."""
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "doc.md").write_text("")
+
+        result = asyncio.run(scan_directory_async(tmp_path, max_files=2))
+
+        assert result == scan_directory(tmp_path, max_files=2)
+        assert result.truncated == "max files (2) reached"
+
+    def test_timeout_while_listing(self, tmp_path, slow_listing):
+        """Test that the timeout also covers a listing still in progress."""
+        (tmp_path / "doc.md").write_text("")
+
+        result = asyncio.run(scan_directory_async(tmp_path, timeout=0.01))
+
+        assert result.truncated == "timeout (0.01s) reached"
+        assert result.total_files == 0
+
+    def test_cancellation(self, tmp_path, slow_listing):
+        """Test that cancelling a scan task propagates CancelledError."""
+        (tmp_path / "doc.md").write_text("")
+
+        async def run():
+            task = asyncio.create_task(scan_directory_async(tmp_path))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            await task
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(run())
+
+    def test_nonexistent_path(self):
+        """Test that a missing root raises ValueError."""
+        with pytest.raises(ValueError, match="Path does not exist"):
+            asyncio.run(scan_directory_async("/nonexistent/path"))
+
+    def test_concurrent_scans_on_one_executor(self):
+        """Test that concurrent scans can share a single worker thread."""
+        path = FIXTURES_DIR / "sample-docs"
+
+        async def run():
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return await asyncio.gather(
+                    *(scan_directory_async(path, executor=executor) for _ in range(4))
+                )
+
+        results = asyncio.run(run())
+
+        assert results == [scan_directory(path)] * 4
+
+    def test_shared_executor(self):
+        """Test that the default executor is created once."""
+        assert get_executor() is get_executor()
+
+
+class TestIterDirectory:
+    """Tests for iter_directory function."""
+
+    def test_yields_in_scan_order(self, tmp_path):
+        """Test that entries arrive in the same order as the sync scan."""
+        for name in ("b", "a", "a/z", "a/y", "c"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "doc.md").write_text("")
+        (tmp_path / "root.md").write_text("")
+
+        entries = asyncio.run(collect(tmp_path, prefetch=1))
+
+        assert entries == list(scan_directory(tmp_path).directories.items())
+        assert [d for d, _ in entries] == ["", "a", "a/y", "a/z", "b", "c"]
+
+    def test_early_exit(self, tmp_path):
+        """Test that a consumer can stop iterating part way through."""
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "doc.md").write_text("")
+
+        async def first():
+            entries = iter_directory(tmp_path)
+            async for entry in entries:
+                await entries.aclose()
+                return entry
+
+        assert asyncio.run(first()) == ("a", ["doc.md"])
+
+
+class TestFormatAsync:
+    """Tests for format_async function."""
+
+    def test_matches_format(self):
+        """Test that async rendering matches the formatter output."""
+        data = IndexData(name="Docs", root="./docs", directories={"": ["a.md"]})
+        formatter = get_formatter("pipe")
+
+        assert asyncio.run(format_async(formatter, data)) == formatter.format(data)
@@ -0,0 +1,92 @@
+"""Tests for the annotate module."""
+
+import os
+
+import pytest
+
+from ai_docs_indexer import annotate as annotate_module
+from ai_docs_indexer.annotate import annotate, count_lines
+from ai_docs_indexer.formatters import Annotation
+from ai_docs_indexer.scanner import scan_directory
+
+
+@pytest.fixture
+def docs(tmp_path):
+    """Create docs with known sizes and line counts."""
+    root = tmp_path / "docs"
+    (root / "guides").mkdir(parents=True)
+    (root / "README.md").write_bytes(b"# Title\n\nBody\n")
+    (root / "guides" / "install.md").write_bytes(b"one\ntwo")
+    (root / "guides" / "empty.md").write_bytes(b"")
+    os.utime(root / "README.md", (0, 1_800_000_000))
+    return root
+
+
+class TestCountLines:
+    """Tests for count_lines function."""
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [(b"", 0), (b"a", 1), (b"a\n", 1), (b"a\nb", 2), (b"\n\n\n", 3)],
+    )
+    def test_counts(self, tmp_path, content, expected):
+        """Test counting with and without a trailing newline."""
+        path = tmp_path / "f.md"
+        path.write_bytes(content)
+
+        assert count_lines(path) == expected
+
+    def test_chunk_boundaries(self, tmp_path, monkeypatch):
+        """Test that lines spanning chunks are counted once."""
+        monkeypatch.setattr(annotate_module, "_LINE_CHUNK", 4)
+        path = tmp_path / "f.md"
+        path.write_bytes(b"abc\ndefghij\nk\n\nlast")
+
+        assert count_lines(path) == 5
+
+
+class TestAnnotate:
+    """Tests for annotate function."""
+
+    def test_all_fields(self, docs):
+        """Test size, line count and date for each file."""
+        result = scan_directory(docs, stat_files=True)
+
+        annotations = annotate(result)
+
+        assert {path: (a.size, a.lines) for path, a in annotations.items()} == {
+            "README.md": (14, 3),
+            os.path.join("guides", "empty.md"): (0, 0),
+            os.path.join("guides", "install.md"): (7, 2),
+        }
+        assert annotations["README.md"].modified == "2027-01-15"
+
+    def test_selected_fields(self, docs):
+        """Test that unrequested fields are left unset."""
+        result = scan_directory(docs, stat_files=True)
+
+        assert annotate(result, ("size",))["README.md"] == Annotation(size=14)
+
+    def test_line_counts_cached(self, docs, tmp_path, monkeypatch):
+        """Test that unchanged files are not read again."""
+        cache_path = tmp_path / "lines.json"
+        result = scan_directory(docs, stat_files=True)
+        annotate(result, ("lines",), cache_path=cache_path)
+
+        def fail(path):
+            raise AssertionError(f"{path} was read again")
+
+        monkeypatch.setattr(annotate_module, "count_lines", fail)
+        annotations = annotate(result, ("lines",), cache_path=cache_path)
+
+        assert annotations["README.md"].lines == 3
+
+    def test_requires_file_stats(self, docs):
+        """Test that a scan without stat data is rejected."""
+        with pytest.raises(ValueError, match="stat_files"):
+            annotate(scan_directory(docs))
+
+    def test_unknown_field(self, docs):
+        """Test that unknown fields are rejected."""
+        with pytest.raises(ValueError, match="Unknown annotation fields: color"):
+            annotate(scan_directory(docs, stat_files=True), ("size", "color"))
@@ -0,0 +1,66 @@
+"""Tests for the cache module."""
+
+import os
+
+from ai_docs_indexer.cache import FileCache, default_cache_path
+
+
+class TestFileCache:
+    """Tests for FileCache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that values survive a save and reload while the file is unchanged."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("hello")
+        cache_path = tmp_path / "cache" / "test.json"
+
+        cache = FileCache(cache_path)
+        cache.set("doc.md", os.stat(doc), ["a.md"])
+        cache.save()
+
+        assert FileCache(cache_path).get("doc.md", os.stat(doc)) == ["a.md"]
+
+    def test_invalidated_by_change(self, tmp_path):
+        """Test that a size or mtime change invalidates the entry."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("hello")
+        cache = FileCache()
+        cache.set("doc.md", os.stat(doc), 1)
+
+        doc.write_text("hello, world")
+
+        assert cache.get("doc.md", os.stat(doc)) is None
+
+    def test_unused_entries_pruned(self, tmp_path):
+        """Test that entries not touched in a run are dropped on save."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("hello")
+        cache_path = tmp_path / "test.json"
+        cache = FileCache(cache_path)
+        cache.set("doc.md", os.stat(doc), 1)
+        cache.set("gone.md", os.stat(doc), 2)
+        cache.save()
+
+        cache = FileCache(cache_path)
+        cache.get("doc.md", os.stat(doc))
+        cache.save()
+
+        assert FileCache(cache_path).get("gone.md", os.stat(doc)) is None
+
+    def test_corrupt_cache_ignored(self, tmp_path):
+        """Test that an unreadable cache file starts empty."""
+        cache_path = tmp_path / "test.json"
+        cache_path.write_text("{not json")
+
+        assert FileCache(cache_path).get("doc.md", os.stat(cache_path)) is None
+
+
+def test_default_cache_path(tmp_path, monkeypatch):
+    """Test that caches go under XDG_CACHE_HOME, one file per root."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    path = default_cache_path(tmp_path / "docs", "links")
+
+    assert path.parent == tmp_path / "ai-docs-indexer"
+    assert path.name.startswith("links-")
+    assert path != default_cache_path(tmp_path / "other", "links")
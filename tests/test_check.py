@@ -0,0 +1,177 @@
+"""Tests for the check module."""
+
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from ai_docs_indexer.check import check_index, fingerprint
+from ai_docs_indexer.formatters import IndexData, get_formatter
+from ai_docs_indexer.scanner import ScanResult, scan_directory
+
+
+@pytest.fixture
+def docs(tmp_path):
+    """Create a small docs tree."""
+    (tmp_path / "guides").mkdir()
+    (tmp_path / "README.md").write_text("# README")
+    (tmp_path / "guides" / "install.md").write_text("# Install")
+    return tmp_path
+
+
+def builder(result, **metadata):
+    """Return a build callback that turns a scan into index data."""
+    return lambda: IndexData(
+        name="Scanned",
+        root="./scanned",
+        directories=result.directories,
+        metadata=metadata,
+    )
+
+
+def render(data, format_name="pipe", **metadata):
+    """Render index data the way the scan command does."""
+    return get_formatter(format_name).format(
+        replace(
+            data,
+            name="Docs",
+            root="./docs",
+            instruction="Read first",
+            metadata={**data.metadata, **metadata},
+        )
+    )
+
+
+def not_called():
+    """Fail if the index is rebuilt."""
+    raise AssertionError("build was called")
+
+
+class TestFingerprint:
+    """Tests for fingerprint function."""
+
+    def listing(self, directories, **kwargs):
+        """Build a scan result for a listing."""
+        return ScanResult(directories, sum(map(len, directories.values())), Path("."), **kwargs)
+
+    def test_stable(self):
+        """Test that equal listings hash equally."""
+        result = self.listing({"": ["a.md"], "b": ["c.md"]})
+
+        assert fingerprint(result) == fingerprint(self.listing({"": ["a.md"], "b": ["c.md"]}))
+        assert fingerprint(result).startswith("sha256:")
+
+    def test_sensitive_to_names_and_structure(self):
+        """Test that renames and moves between directories change the hash."""
+        base = fingerprint(self.listing({"": ["a.md"], "b": ["c.md"]}))
+
+        assert fingerprint(self.listing({"": ["a.md"], "b": ["d.md"]})) != base
+        assert fingerprint(self.listing({"": ["a.md", "c.md"], "b": []})) != base
+        assert fingerprint(self.listing({"": ["a.md"], "b": ["c.md"], "e": []})) != base
+
+    def test_sensitive_to_truncation_and_options(self):
+        """Test that the truncation reason and post-scan options change the hash."""
+        result = self.listing({"": ["a.md", "b.md"]})
+        base = fingerprint(result)
+
+        assert fingerprint(result._replace(truncated="max files (2) reached")) != base
+        assert fingerprint(result, {"links": True}) != base
+        assert fingerprint(result, {"links": True}) != fingerprint(result, {"collapse": True})
+
+    def test_stat_data(self, docs):
+        """Test that stat data makes content edits change the hash."""
+        base = fingerprint(scan_directory(docs, stat_files=True))
+        assert fingerprint(scan_directory(docs, stat_files=True)) == base
+        assert fingerprint(scan_directory(docs)) != base
+
+        os.utime(docs / "README.md", ns=(0, 0))
+        touched = fingerprint(scan_directory(docs, stat_files=True))
+        assert touched != base
+
+        (docs / "README.md").write_text("# README, edited")
+        os.utime(docs / "README.md", ns=(0, 0))
+        assert fingerprint(scan_directory(docs, stat_files=True)) != touched
+
+
+class TestCheckIndex:
+    """Tests for check_index function."""
+
+    def test_fingerprint_fresh(self, docs):
+        """Test that a matching fingerprint decides without building the index."""
+        result = scan_directory(docs)
+        text = render(builder(result)(), fingerprint=fingerprint(result))
+
+        outcome = check_index(text, get_formatter("pipe"), scan_directory(docs), not_called)
+
+        assert outcome.fresh
+        assert outcome.method == "fingerprint"
+
+    def test_fingerprint_stale(self, docs):
+        """Test that an added file is caught after the fingerprint mismatches."""
+        result = scan_directory(docs)
+        text = render(builder(result)(), fingerprint=fingerprint(result))
+        (docs / "guides" / "usage.md").write_text("")
+
+        current = scan_directory(docs)
+        outcome = check_index(text, get_formatter("pipe"), current, builder(current))
+
+        assert not outcome.fresh
+        assert outcome.method == "render"
+
+    def test_fingerprint_options(self, docs):
+        """Test that different options do not match the recorded fingerprint."""
+        result = scan_directory(docs)
+        text = render(builder(result)(), fingerprint=fingerprint(result, {"collapse": True}))
+
+        outcome = check_index(text, get_formatter("pipe"), result, builder(result))
+
+        assert outcome == (True, "render", fingerprint(result))
+
+    def test_outdated_fingerprint(self, docs):
+        """Test that an outdated fingerprint falls back to the full comparison."""
+        result = scan_directory(docs, stat_files=True)
+        text = render(builder(result)(), fingerprint=fingerprint(result))
+        os.utime(docs / "README.md", ns=(0, 0))
+
+        current = scan_directory(docs, stat_files=True)
+        outcome = check_index(text, get_formatter("pipe"), current, builder(current))
+
+        assert outcome.fresh
+        assert outcome.method == "render"
+
+    @pytest.mark.parametrize("format_name", ["pipe", "json", "yaml", "dict"])
+    def test_render_fallback(self, docs, format_name):
+        """Test comparing rendered output when no fingerprint was recorded."""
+        result = scan_directory(docs)
+        formatter = get_formatter(format_name)
+        text = render(builder(result, links="0 links, 0 broken")(), format_name)
+
+        assert check_index(
+            text + "\n", formatter, result, builder(result, links="0 links, 0 broken")
+        ) == (True, "render", fingerprint(result))
+
+        (docs / "README.md").rename(docs / "index.md")
+        current = scan_directory(docs)
+        assert not check_index(
+            text, formatter, current, builder(current, links="0 links, 0 broken")
+        ).fresh
+
+    def test_render_fallback_metadata(self, docs):
+        """Test that metadata is compared rather than copied from the index."""
+        result = scan_directory(docs)
+        text = render(builder(result, links="1 links, 0 broken")())
+
+        assert not check_index(text, get_formatter("pipe"), result, builder(result)).fresh
+
+    def test_render_fallback_compressed(self, docs):
+        """Test that --compress output is recognized."""
+        result = scan_directory(docs)
+        text = render(builder(result)()).replace("\n", "")
+
+        assert check_index(text, get_formatter("pipe"), result, builder(result)).fresh
+
+    def test_not_an_index(self, docs):
+        """Test that unparsable input raises ValueError."""
+        with pytest.raises(ValueError):
+            check_index("hello", get_formatter("pipe"), scan_directory(docs), not_called)
@@ -1,5 +1,7 @@
 """Tests for the CLI module."""
 
+import json
+import os
 import tempfile
 from pathlib import Path
 
@@ -72,6 +74,399 @@ class TestScanCommand:
         lines = result.output.strip().split("\n")
         assert len(lines) == 1
 
+    def test_scan_dedupe_reports_skipped(self, runner, temp_docs):
+        """Test that --dedupe drops hard links and reports them."""
+        (temp_docs / "zz-copy.md").hardlink_to(temp_docs / "guide.md")
+        result = runner.invoke(main, ["scan", str(temp_docs), "--dedupe"])
+        assert result.exit_code == 0
+        assert "Skipped" in result.output
+        assert "{README.md,guide.md}" in result.output
+
+    def test_scan_changed_from(self, runner, temp_docs, tmp_path):
+        """Test updating a previous index from changed paths on stdin."""
+        index = tmp_path / "AGENTS.md"
+        result = runner.invoke(main, ["scan", str(temp_docs), "-q", "-o", str(index)])
+        assert result.exit_code == 0
+
+        new_file = temp_docs / "getting-started" / "usage.md"
+        new_file.write_text("# Usage")
+        result = runner.invoke(
+            main,
+            ["scan", str(temp_docs), "-q", "--changed-from", str(index), "--paths-from-stdin"],
+            input=f"{new_file}\n",
+        )
+        assert result.exit_code == 0
+        assert "|getting-started:{install.md,usage.md}" in result.output
+
+    def test_scan_changed_from_collapsed_index(self, runner, temp_docs, tmp_path):
+        """Test that range expressions in the previous index are expanded."""
+        other = temp_docs / "other"
+        other.mkdir()
+        for n in range(1, 5):
+            (other / f"0{n}-x.md").write_text("")
+        index = tmp_path / "AGENTS.md"
+        runner.invoke(main, ["scan", str(temp_docs), "-q", "--collapse-series", "-o", str(index)])
+        assert "|other:{{01..04-x.md (4)}}" in index.read_text()
+
+        new_file = temp_docs / "guide2.md"
+        new_file.write_text("")
+        result = runner.invoke(
+            main,
+            ["scan", str(temp_docs), "-q", "--changed-from", str(index), "--paths-from-stdin"],
+            input=f"{new_file}\n",
+        )
+
+        assert result.exit_code == 0
+        assert "|other:{01-x.md,02-x.md,03-x.md,04-x.md}" in result.output
+
+    def test_scan_changed_from_requires_stdin(self, runner, temp_docs, tmp_path):
+        """Test that --changed-from needs --paths-from-stdin."""
+        index = tmp_path / "AGENTS.md"
+        index.write_text("[Docs]|root: ./docs")
+        result = runner.invoke(main, ["scan", str(temp_docs), "--changed-from", str(index)])
+        assert result.exit_code == 2
+
+    def test_scan_changed_from_rejects_budgets(self, runner, temp_docs, tmp_path):
+        """Test that scan budgets cannot be silently dropped by an update."""
+        index = tmp_path / "AGENTS.md"
+        index.write_text("[Docs]|root: ./docs")
+        result = runner.invoke(
+            main,
+            ["scan", str(temp_docs), "--changed-from", str(index), "--paths-from-stdin",
+             "--max-files", "1"],
+            input="README.md\n",
+        )
+        assert result.exit_code == 2
+        assert "cannot be combined with --changed-from" in result.output
+
+    def test_scan_max_files_marks_truncation(self, runner, temp_docs):
+        """Test that a tripped limit is reported and marked in the output."""
+        result = runner.invoke(main, ["scan", str(temp_docs), "--max-files", "1"])
+        assert result.exit_code == 0
+        assert "Truncated:" in result.output
+        assert "|TRUNCATED: max files (1) reached" in result.output
+
+    def test_scan_manifest(self, runner, temp_docs, tmp_path):
+        """Test building the index from a manifest instead of walking."""
+        manifest = tmp_path / "docs.manifest"
+        manifest.write_bytes(b"./README.md\0./only-in-manifest/page.md\0")
+        result = runner.invoke(
+            main, ["scan", str(temp_docs), "-q", "--manifest", str(manifest)]
+        )
+        assert result.exit_code == 0
+        assert "|only-in-manifest:{page.md}" in result.output
+        assert "guide.md" not in result.output
+
+    def test_scan_manifest_budgets(self, runner, temp_docs, tmp_path):
+        """Test that --max-files applies to manifests and walk-only limits are rejected."""
+        manifest = tmp_path / "manifest"
+        manifest.write_text("README.md\nguide.md\ngetting-started/install.md\n")
+
+        result = runner.invoke(
+            main, ["scan", str(temp_docs), "--manifest", str(manifest), "--max-files", "1", "-q"]
+        )
+        assert result.exit_code == 0
+        assert "|TRUNCATED: max files (1) reached" in result.output
+        assert "guide.md" not in result.output
+
+        result = runner.invoke(
+            main, ["scan", str(temp_docs), "--manifest", str(manifest), "--timeout", "5"]
+        )
+        assert result.exit_code == 2
+        assert "cannot be combined with --manifest" in result.output
+
+    def test_scan_links(self, runner, temp_docs, tmp_path, monkeypatch):
+        """Test the link pass ranks files and writes the graph."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        (temp_docs / "README.md").write_text("[guide](guide.md) [gone](gone.md)")
+        (temp_docs / "getting-started" / "install.md").write_text("[g](../guide.md)")
+        graph_path = tmp_path / "links.json"
+
+        result = runner.invoke(
+            main, ["scan", str(temp_docs), "--links-output", str(graph_path)]
+        )
+
+        assert result.exit_code == 0
+        assert "broken README.md -> gone.md" in result.output
+        assert "|links: 2 links, 1 broken" in result.output
+        assert "|.:{guide.md,README.md}" in result.output
+        assert "guide.md" in json.loads(graph_path.read_text())["in_degree"]
+
+    def test_scan_links_max_files(self, runner, temp_docs, tmp_path, monkeypatch):
+        """Test that --max-files with --links keeps the most linked file."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        (temp_docs / "README.md").write_text("[install](getting-started/install.md)")
+
+        result = runner.invoke(
+            main, ["scan", str(temp_docs), "--links", "--max-files", "1", "-q"]
+        )
+
+        assert result.exit_code == 0
+        assert "|getting-started:{install.md}" in result.output
+        assert "README.md" not in result.output
+        assert "|TRUNCATED: max files (1) reached" in result.output
+
+    def test_scan_collapse_series(self, runner, temp_docs):
+        """Test that numbered runs are collapsed on request."""
+        for n in range(1, 6):
+            (temp_docs / f"v1.{n}.0.md").write_text("")
+        result = runner.invoke(main, ["scan", str(temp_docs), "-q", "--collapse-series"])
+        assert result.exit_code == 0
+        assert "|.:{README.md,guide.md,{v1.1.0..v1.5.0.md (5)}}" in result.output
+
+    def test_scan_annotate(self, runner, temp_docs, tmp_path, monkeypatch):
+        """Test that --annotate adds size and line suffixes."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        result = runner.invoke(
+            main, ["scan", str(temp_docs), "--annotate", "lines", "--annotate", "size", "-q"]
+        )
+        assert result.exit_code == 0
+        assert "|.:{README.md~8#1,guide.md~7#1}" in result.output
+
+    def test_scan_annotate_links_max_files(self, runner, temp_docs, tmp_path, monkeypatch):
+        """Test that only the files kept by --links --max-files are annotated."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        (temp_docs / "README.md").write_text("[install](getting-started/install.md)")
+        lines_read = []
+        monkeypatch.setattr(
+            "ai_docs_indexer.annotate.count_lines",
+            lambda path: lines_read.append(path) or 1,
+        )
+
+        result = runner.invoke(
+            main,
+            [
+                "scan", str(temp_docs), "-q", "-f", "json", "--links", "--max-files", "1",
+                "--annotate", "size", "--annotate", "lines",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["directories"] == {"getting-started": ["install.md"]}
+        assert list(data["annotations"]) == ["getting-started/install.md"]
+        assert lines_read == [str(temp_docs / "getting-started" / "install.md")]
+
+    def test_scan_annotate_rejects_manifest(self, runner, temp_docs, tmp_path):
+        """Test that --annotate needs a directory walk."""
+        manifest = tmp_path / "manifest"
+        manifest.write_text("README.md\n")
+        result = runner.invoke(
+            main, ["scan", str(temp_docs), "--manifest", str(manifest), "--annotate", "size"]
+        )
+        assert result.exit_code == 2
+        assert "--annotate cannot be combined" in result.output
+
+
+class TestCheckCommand:
+    """Tests for the check command."""
+
+    def test_check_fingerprinted_index(self, runner, temp_docs, tmp_path):
+        """Test that check passes until an indexed file is added."""
+        index = tmp_path / "AGENTS.md"
+        result = runner.invoke(
+            main, ["scan", str(temp_docs), "--fingerprint", "-o", str(index), "--quiet"]
+        )
+        assert result.exit_code == 0
+        assert "|fingerprint: sha256:" in index.read_text()
+
+        result = runner.invoke(main, ["check", str(temp_docs), "--against", str(index)])
+        assert result.exit_code == 0
+        assert "Up to date" in result.output
+        assert "fingerprint" in result.output
+
+        (temp_docs / "new.md").write_text("")
+        result = runner.invoke(main, ["check", str(temp_docs), "--against", str(index)])
+        assert result.exit_code == 1
+        assert "Stale" in result.output
+
+    def test_check_without_fingerprint(self, runner, temp_docs, tmp_path):
+        """Test the render comparison for indexes without a fingerprint."""
+        index = tmp_path / "index.json"
+        runner.invoke(
+            main, ["scan", str(temp_docs), "-f", "json", "-i", "Read me", "-o", str(index), "-q"]
+        )
+
+        result = runner.invoke(
+            main, ["check", str(temp_docs), "--against", str(index), "-f", "json", "-q"]
+        )
+        assert result.exit_code == 0
+        assert result.output == ""
+
+        (temp_docs / "guide.md").unlink()
+        result = runner.invoke(
+            main, ["check", str(temp_docs), "--against", str(index), "-f", "json", "-q"]
+        )
+        assert result.exit_code == 1
+
+    @pytest.mark.parametrize("fingerprinted", [False, True])
+    @pytest.mark.parametrize(
+        "options",
+        [
+            ["--collapse-series"],
+            ["--links"],
+            ["--links", "--max-files", "2"],
+            ["--max-depth", "0"],
+        ],
+    )
+    def test_check_scan_options(
+        self, runner, temp_docs, tmp_path, monkeypatch, options, fingerprinted
+    ):
+        """Test that indexes generated with scan options check as up to date."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        for n in range(1, 6):
+            (temp_docs / f"{n:02d}-step.md").write_text("[guide](guide.md)")
+        index = tmp_path / "AGENTS.md"
+        extra = ["--fingerprint"] if fingerprinted else []
+        runner.invoke(main, ["scan", str(temp_docs), "-q", "-o", str(index), *options, *extra])
+
+        result = runner.invoke(main, ["check", str(temp_docs), "--against", str(index), *options])
+        assert result.exit_code == 0, result.output
+        assert "Up to date" in result.output
+
+        (temp_docs / "06-step.md").write_text("")
+        result = runner.invoke(main, ["check", str(temp_docs), "--against", str(index), *options])
+        if "--max-files" in options:
+            # 06-step.md has no inbound links, so the budget still drops it
+            assert result.exit_code == 0
+        else:
+            assert result.exit_code == 1
+            assert "Stale" in result.output
+
+    def test_check_fingerprint_skips_rebuild(self, runner, temp_docs, tmp_path, monkeypatch):
+        """Test that a matching fingerprint skips link parsing and annotations."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        index = tmp_path / "AGENTS.md"
+        options = ["--links", "--annotate", "lines"]
+        runner.invoke(
+            main, ["scan", str(temp_docs), "-q", "-o", str(index), "--fingerprint", *options]
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("index was rebuilt")
+
+        with monkeypatch.context() as patch:
+            patch.setattr("ai_docs_indexer.cli.extract_links", fail)
+            patch.setattr("ai_docs_indexer.cli.annotate", fail)
+            result = runner.invoke(
+                main, ["check", str(temp_docs), "--against", str(index), "--links"]
+            )
+        assert result.exit_code == 0, result.output
+        assert "fingerprint" in result.output
+
+        # New mtimes alone (as after a fresh clone) fall back to the full comparison
+        os.utime(temp_docs / "guide.md", ns=(0, 0))
+        result = runner.invoke(main, ["check", str(temp_docs), "--against", str(index), "--links"])
+        assert result.exit_code == 0, result.output
+        assert "render" in result.output
+
+        (temp_docs / "guide.md").write_text("[readme](README.md)")
+        result = runner.invoke(main, ["check", str(temp_docs), "--against", str(index), "--links"])
+        assert result.exit_code == 1
+        assert "Stale" in result.output
+
+    @pytest.mark.parametrize(
+        "options, hint",
+        [
+            (["--collapse-series"], "pass --collapse-series"),
+            (["--links"], "pass --links"),
+            (["--max-files", "2"], "pass the same --max-depth"),
+        ],
+    )
+    def test_check_missing_scan_options(
+        self, runner, temp_docs, tmp_path, monkeypatch, options, hint
+    ):
+        """Test that an index check cannot reproduce is an error, not stale."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        for n in range(1, 6):
+            (temp_docs / f"{n:02d}-step.md").write_text("")
+        index = tmp_path / "AGENTS.md"
+        runner.invoke(main, ["scan", str(temp_docs), "-q", "-o", str(index), *options])
+
+        result = runner.invoke(main, ["check", str(temp_docs), "--against", str(index)])
+        assert result.exit_code == 2
+        assert hint in result.output
+        assert "Stale" not in result.output
+
+    def test_check_timeout_index(self, runner, temp_docs, tmp_path):
+        """Test that an index cut short by --timeout is rejected."""
+        index = tmp_path / "AGENTS.md"
+        index.write_text("[Docs]|root: ./docs|TRUNCATED: timeout (1s) reached|.:{README.md}")
+
+        result = runner.invoke(
+            main, ["check", str(temp_docs), "--against", str(index), "--max-files", "1"]
+        )
+        assert result.exit_code == 2
+        assert "--timeout" in result.output
+
+    def test_check_annotated_fingerprint(self, runner, temp_docs, tmp_path, monkeypatch):
+        """Test that a fingerprint over annotations catches content changes."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        index = tmp_path / "AGENTS.md"
+        runner.invoke(
+            main,
+            [
+                "scan", str(temp_docs), "-q", "-o", str(index), "--fingerprint",
+                "--annotate", "size", "--annotate", "lines",
+            ],
+        )
+
+        result = runner.invoke(main, ["check", str(temp_docs), "--against", str(index)])
+        assert result.exit_code == 0, result.output
+        assert "fingerprint" in result.output
+
+        (temp_docs / "guide.md").write_text("# Guide\n\nMore text\n")
+        result = runner.invoke(main, ["check", str(temp_docs), "--against", str(index)])
+        assert result.exit_code == 1
+        assert "Stale" in result.output
+
+    @pytest.mark.parametrize("format_name", ["pipe", "json"])
+    def test_check_annotated_render(
+        self, runner, temp_docs, tmp_path, monkeypatch, format_name
+    ):
+        """Test that an annotated index without fingerprint is fresh when generated."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        index = tmp_path / "AGENTS.md"
+        runner.invoke(
+            main,
+            [
+                "scan", str(temp_docs), "-q", "-o", str(index), "-f", format_name,
+                "--annotate", "size", "--annotate", "mtime",
+            ],
+        )
+        check = ["check", str(temp_docs), "--against", str(index), "-f", format_name]
+
+        result = runner.invoke(main, check)
+        assert result.exit_code == 0, result.output
+        assert "render" in result.output
+
+        (temp_docs / "guide.md").write_text("# Guide\n" * 100)
+        result = runner.invoke(main, check)
+        assert result.exit_code == 1
+
+    def test_check_wrong_format(self, runner, temp_docs, tmp_path):
+        """Test that an unparsable index is an error."""
+        index = tmp_path / "AGENTS.md"
+        index.write_text("not an index")
+
+        result = runner.invoke(main, ["check", str(temp_docs), "--against", str(index)])
+        assert result.exit_code == 1
+        assert "Error" in result.output
+
+
+class TestStatsCommand:
+    """Tests for the stats command."""
+
+    def test_stats_basic(self, runner, temp_docs):
+        """Test stats reports formats and directories."""
+        result = runner.invoke(main, ["stats", str(temp_docs)])
+        assert result.exit_code == 0
+        assert "3 files" in result.output
+        assert "pipe" in result.output
+        assert "yaml" in result.output
+        assert "dict" in result.output
+        assert "getting-started" in result.output
+
 
 class TestFormatsCommand:
     """Tests for the formats command."""
@@ -83,3 +478,4 @@ class TestFormatsCommand:
         assert "pipe" in result.output
         assert "json" in result.output
         assert "yaml" in result.output
+        assert "dict" in result.output
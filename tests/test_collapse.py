@@ -0,0 +1,150 @@
+"""Tests for the collapse module."""
+
+import pytest
+
+from ai_docs_indexer.collapse import (
+    collapse_files,
+    collapse_series,
+    expand_directories,
+    expand_series,
+    parse_series,
+)
+
+
+class TestCollapseFiles:
+    """Tests for collapse_files."""
+
+    def test_numbered_steps(self):
+        """Test a contiguous zero-padded series."""
+        files = ["README.md"] + [f"{n:02d}-step.md" for n in range(1, 88)] + ["zz.md"]
+
+        assert collapse_files(files) == ["README.md", "{01..87-step.md (87)}", "zz.md"]
+
+    def test_semver_series(self):
+        """Test that versioned files collapse to their range."""
+        files = ["v0.1.0.md", "v0.10.2.md", "v4.12.3.md", "v1.0.0.md", "index.md"]
+
+        assert collapse_files(files) == ["{v0.1.0..v4.12.3.md (4)}", "index.md"]
+
+    def test_gaps_not_collapsed(self):
+        """Test that non-contiguous numbers are kept, since they could not be expanded."""
+        files = ["part1.md", "part2.md", "part4.md"]
+
+        assert collapse_files(files) == files
+
+    def test_mixed_padding_not_collapsed(self):
+        """Test that inconsistent zero padding is kept."""
+        files = ["1.md", "02.md", "3.md"]
+
+        assert collapse_files(files) == files
+
+    def test_short_runs_kept(self):
+        """Test that runs below min_run are kept."""
+        files = ["a1.md", "a2.md", "b.md"]
+
+        assert collapse_files(files) == files
+        assert collapse_files(files, min_run=2) == ["{a1..a2.md (2)}", "b.md"]
+
+    def test_different_templates_kept_apart(self):
+        """Test that only names sharing a template are grouped."""
+        files = ["01-install.md", "02-config.md", "03-deploy.md"]
+
+        assert collapse_files(files) == files
+
+    def test_collapse_series_per_directory(self):
+        """Test collapsing every directory of a mapping."""
+        directories = {
+            "": ["README.md"],
+            "migrations": [f"{n}-migrate.md" for n in range(1, 11)],
+        }
+
+        assert collapse_series(directories) == {
+            "": ["README.md"],
+            "migrations": ["{1..10-migrate.md (10)}"],
+        }
+
+
+class TestExpandSeries:
+    """Tests for parse_series and expand_series."""
+
+    def test_numbered_round_trip(self):
+        """Test that numeric series expand to the original names."""
+        files = [f"{n:03d}-chapter.mdx" for n in range(7, 120)]
+
+        (entry,) = collapse_files(files)
+
+        assert expand_series(entry) == files
+
+    def test_unpadded_round_trip(self):
+        """Test expansion without zero padding."""
+        files = [f"guide-{n}.md" for n in range(8, 13)]
+
+        (entry,) = collapse_files(sorted(files))
+
+        assert entry == "{guide-8..guide-12.md (5)}"
+        assert expand_series(entry) == files
+
+    @pytest.mark.parametrize(
+        "files",
+        [
+            ["a..b1.md", "a..b2.md", "a..b3.md"],
+            ["1..1.md", "1..2.md", "1..3.md"],
+            ["x1..md", "x2..md", "x3..md"],
+            ["v..1.0.0.md", "v..1.2.0.md", "v..2.0.0.md"],
+        ],
+    )
+    def test_dots_in_names_round_trip(self, files):
+        """Test that ".." in a prefix or suffix does not confuse parsing."""
+        (entry,) = collapse_files(files)
+
+        assert parse_series(entry) is not None
+        assert expand_series(entry, candidates=files) == files
+
+    def test_semver_needs_candidates(self):
+        """Test that semver series expand from the directory listing."""
+        files = ["v0.1.0.md", "v0.2.0.md", "v1.0.0.md"]
+        (entry,) = collapse_files(files)
+
+        with pytest.raises(ValueError, match="needs the directory listing"):
+            expand_series(entry)
+        assert expand_series(entry, files + ["v9.9.9.md", "other.md"]) == files
+
+    def test_plain_names(self):
+        """Test that ordinary names are not series."""
+        assert parse_series("README.md") is None
+        assert expand_series("README.md") == ["README.md"]
+
+    def test_parse_fields(self):
+        """Test the parsed series fields."""
+        series = parse_series("{v0.1.0..v4.12.3.md (212)}")
+
+        assert series.kind == "semver"
+        assert series.prefix == "v"
+        assert (series.first, series.last) == ("0.1.0", "4.12.3")
+        assert series.suffix == ".md"
+        assert series.count == 212
+
+
+class TestExpandDirectories:
+    """Tests for expand_directories."""
+
+    def test_expands_numbers_and_relists_semver(self, tmp_path):
+        """Test that every range expression becomes plain filenames."""
+        (tmp_path / "releases").mkdir()
+        for version in ("v1.0.0", "v1.2.0", "v2.0.0"):
+            (tmp_path / "releases" / f"{version}.md").write_text("")
+        collapsed = {
+            "": ["README.md", "{01..03-step.md (3)}"],
+            "releases": ["{v1.0.0..v2.0.0.md (3)}", "index.md"],
+        }
+
+        assert expand_directories(collapsed, tmp_path) == {
+            "": ["01-step.md", "02-step.md", "03-step.md", "README.md"],
+            "releases": ["index.md", "v1.0.0.md", "v1.2.0.md", "v2.0.0.md"],
+        }
+
+    def test_missing_directory(self, tmp_path):
+        """Test that a semver series in a deleted directory expands to nothing."""
+        collapsed = {"gone": ["{v1.0.0..v2.0.0.md (3)}"]}
+
+        assert expand_directories(collapsed, tmp_path) == {"gone": []}
@@ -0,0 +1,217 @@
+"""Differential tests: scan engines against scan_directory, formatters against references."""
+
+import asyncio
+import os
+import random
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ai_docs_indexer.aio import scan_directory_async
+from ai_docs_indexer.formatters import IndexData, available_formats, get_formatter
+from ai_docs_indexer.scanner import rescan_paths, scan_directory, scan_manifest
+
+
+DIR_NAMES = [
+    "docs", "a", "a-b", "a.b", "A", "_build", "z", "space dir", "café",
+    "école", "日本語", "emoji 📚", ".hidden", ".git",
+]
+FILE_STEMS = [
+    "README", "index", "overview", "changelog", "01-step", "v1.2.3", "x",
+    "with space", "a,b", "ünïcödé", "中文", ".hidden", ".md", "",
+]
+EXTENSIONS = [".md", ".md", ".mdx", ".MD", ".txt", ".rst", ".markdown", ".md.bak", ""]
+
+OPTION_SETS = [
+    {},
+    {"include_hidden": True},
+    {"follow_symlinks": True},
+    {"include_hidden": True, "follow_symlinks": True, "extensions": (".md", ".txt")},
+    {"extensions": (".mdx",)},
+    {"dedupe_files": True},
+    {"dedupe_files": True, "follow_symlinks": True, "include_hidden": True},
+    {"max_depth": 2},
+    {"max_depth": 0, "include_hidden": True},
+    {"max_files": 40},
+    {"max_files": 25, "follow_symlinks": True, "include_hidden": True},
+    {"max_dirs": 6},
+    {"max_dirs": 12, "max_depth": 3, "follow_symlinks": True},
+]
+
+
+def build_tree(root: Path, seed: int, entries: int, hard_links: float = 0.1) -> None:
+    """
+    Populate ``root`` with a random tree of roughly ``entries`` entries.
+
+    Trees mix hidden and Unicode names, empty directories, assorted
+    extensions, hard links, and symlinks to files, directories (including
+    ancestors) and missing targets. ``hard_links`` is the share of files
+    created as hard links to earlier ones, which is also much faster than
+    creating new files.
+    """
+    rng = random.Random(seed)
+    # Plain strings and FileExistsError keep this fast enough for 100k entries
+    dirs = [str(root)]
+    depth = {str(root): 0}
+    files: list[str] = []
+    originals: list[str] = []
+    created = 0
+    while created < entries:
+        # Mix recent and random parents so trees grow deep as well as wide
+        if rng.random() < 0.5:
+            parent = dirs[-1 - min(int(rng.expovariate(0.3)), len(dirs) - 1)]
+        else:
+            parent = rng.choice(dirs)
+        suffix = str(rng.randrange(entries)) if rng.random() < 0.5 else ""
+        roll = rng.random()
+        try:
+            if roll < 0.12:
+                if depth[parent] >= 8:
+                    continue
+                path = os.path.join(parent, rng.choice(DIR_NAMES) + suffix)
+                os.mkdir(path)
+                dirs.append(path)
+                depth[path] = depth[parent] + 1
+            elif roll < 0.16:
+                name = rng.choice(FILE_STEMS) + "-link" + suffix + rng.choice(EXTENSIONS)
+                path = os.path.join(parent, name)
+                missing = os.path.join(parent, "missing.md")
+                target = rng.choice([rng.choice(dirs), rng.choice(files or dirs), missing])
+                os.symlink(target, path, target_is_directory=os.path.isdir(target))
+            else:
+                name = rng.choice(FILE_STEMS) + suffix + rng.choice(EXTENSIONS)
+                if not name:
+                    continue
+                path = os.path.join(parent, name)
+                # Link only to originals to stay far below link count limits
+                if originals and rng.random() < hard_links:
+                    os.link(rng.choice(originals), path)
+                else:
+                    os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                    originals.append(path)
+                files.append(path)
+        except FileExistsError:
+            continue
+        created += 1
+
+
+def rescan_engine(root, **options):
+    """Rebuild from nothing by reporting every non-directory entry as changed."""
+    changed = []
+    for dirpath, _dirnames, filenames in os.walk(root):
+        changed.extend(os.path.join(dirpath, f) for f in filenames)
+    return rescan_paths(root, {}, changed, **options)
+
+
+def manifest_engine(root, **options):
+    """Index a NUL-separated list of every non-directory entry, like find -print0."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manifest = Path(tmpdir) / "manifest"
+        with open(manifest, "wb") as f:
+            for dirpath, _dirnames, filenames in os.walk(root):
+                rel = os.path.relpath(dirpath, root)
+                for filename in filenames:
+                    f.write(os.fsencode(os.path.join(".", rel, filename)) + b"\0")
+        return scan_manifest(manifest, root, **options)
+
+
+def stat_engine(root, **options):
+    """The scandir walk used when collecting file stats."""
+    result = scan_directory(root, stat_files=True, **options)
+    listed = {
+        os.path.join(dir_path, filename)
+        for dir_path, filenames in result.directories.items()
+        for filename in filenames
+    }
+    assert set(result.file_stats) == listed
+    return result
+
+
+def async_engine(root, **options):
+    """The asyncio walk, with a small prefetch window to exercise reordering."""
+    return asyncio.run(scan_directory_async(root, prefetch=3, **options))
+
+
+WALK_OPTIONS = {
+    "extensions", "include_hidden", "follow_symlinks", "dedupe_files",
+    "max_depth", "max_files", "max_dirs",
+}
+
+# name -> (engine, supported options); each is compared with scan_directory
+ENGINES = {
+    "rescan": (rescan_engine, {"extensions", "include_hidden"}),
+    "manifest": (manifest_engine, {"extensions", "include_hidden", "max_depth", "max_files"}),
+    "stat": (stat_engine, WALK_OPTIONS),
+    "async": (async_engine, WALK_OPTIONS),
+}
+
+
+def pipe_reference(data: IndexData) -> str:
+    """Render pipe output independently of PipeFormatter."""
+    lines = [f"[{data.name}]|root: {data.root}"]
+    if data.truncated:
+        lines.append(f"|TRUNCATED: {data.truncated}")
+    for dir_path in sorted(data.directories):
+        lines.append(f"|{dir_path or '.'}:{{{','.join(data.directories[dir_path])}}}")
+    return "\n".join(lines)
+
+
+def assert_formatters(reference) -> None:
+    """Check every formatter against a rendering or parse made without it."""
+    data = IndexData(
+        name="Docs",
+        root="./docs",
+        directories=reference.directories,
+        truncated=reference.truncated,
+    )
+    for format_name in available_formats():
+        formatter = get_formatter(format_name)
+        output = formatter.format(data)
+        if format_name == "pipe":
+            # Pipe output is not escaped, so it cannot be parsed back losslessly
+            assert output == pipe_reference(data)
+        else:
+            parsed = formatter.parse(output)
+            assert parsed.directories == data.directories, format_name
+            assert parsed.truncated == data.truncated, format_name
+
+
+def assert_equivalent(root: Path, options: dict, skip: tuple[str, ...] = ()) -> None:
+    """Run every engine that supports ``options`` and compare against the reference."""
+    reference = scan_directory(root, **options)
+    for engine_name, (engine, supported) in ENGINES.items():
+        if engine_name in skip or not supported.issuperset(options):
+            continue
+        result = engine(root, **options)
+
+        assert result.root_path == reference.root_path, engine_name
+        assert list(result.directories.items()) == list(reference.directories.items()), engine_name
+        assert result.total_files == reference.total_files, engine_name
+        if engine_name == "manifest" and (reference.truncated or "").startswith("max depth"):
+            # A file list cannot show directories below the limit that hold
+            # no files, so the manifest may miss depth truncation (see
+            # scan_manifest), but must never invent it
+            assert result.truncated in (reference.truncated, None), engine_name
+        else:
+            assert result.truncated == reference.truncated, engine_name
+        assert result.skipped == reference.skipped, engine_name
+
+    assert_formatters(reference)
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_random_trees(tmp_path, seed):
+    """Engines agree on small random trees under every option set."""
+    build_tree(tmp_path, seed, entries=300)
+    for options in OPTION_SETS:
+        assert_equivalent(tmp_path, options)
+
+
+def test_large_tree(tmp_path):
+    """Fast scan engines agree on a 100k-entry tree."""
+    # Creating inodes dominates the runtime, so most files are hard links;
+    # rescan_paths is an update path, not a scan engine, and is covered by
+    # the random trees
+    build_tree(tmp_path, seed=2024, entries=100_000, hard_links=0.95)
+    assert_equivalent(tmp_path, {}, skip=("rescan",))
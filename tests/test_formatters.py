@@ -6,6 +6,8 @@ import pytest
 import yaml
 
 from ai_docs_indexer.formatters import (
+    Annotation,
+    DictionaryFormatter,
     IndexData,
     JsonFormatter,
     PipeFormatter,
@@ -57,6 +59,11 @@ class TestGetFormatter:
         formatter = get_formatter("yaml")
         assert isinstance(formatter, YamlFormatter)
 
+    def test_get_dict_formatter(self):
+        """Test getting dictionary formatter."""
+        formatter = get_formatter("dict")
+        assert isinstance(formatter, DictionaryFormatter)
+
     def test_unknown_formatter(self):
         """Test that unknown format raises error."""
         with pytest.raises(ValueError, match="Unknown format"):
@@ -87,6 +94,15 @@ class TestPipeFormatter:
         assert "IMPORTANT" not in result
         assert "|.:{index.md}" in result
 
+    def test_parse_round_trip(self, sample_data, minimal_data):
+        """Test parsing pipe output, plain and compressed."""
+        formatter = PipeFormatter()
+        data = IndexData(**{**vars(sample_data), "metadata": {"version": "1.0"}})
+        for item in (data, minimal_data):
+            text = formatter.format(item)
+            assert formatter.parse(text) == item
+            assert formatter.parse(text.replace("\n", "")) == item
+
     def test_name_and_extension(self):
         """Test formatter metadata."""
         formatter = PipeFormatter()
@@ -117,6 +133,16 @@ class TestJsonFormatter:
         assert data["name"] == "Minimal"
         assert "instruction" not in data
 
+    def test_parse_round_trip(self, sample_data):
+        """Test parsing JSON output."""
+        formatter = JsonFormatter()
+        assert formatter.parse(formatter.format(sample_data)) == sample_data
+
+    def test_parse_invalid(self):
+        """Test that non-JSON text is rejected."""
+        with pytest.raises(ValueError, match="Not a JSON index"):
+            JsonFormatter().parse("[Docs]|root: ./docs")
+
     def test_name_and_extension(self):
         """Test formatter metadata."""
         formatter = JsonFormatter()
@@ -147,6 +173,11 @@ class TestYamlFormatter:
         assert data["name"] == "Minimal"
         assert "instruction" not in data
 
+    def test_parse_round_trip(self, sample_data):
+        """Test parsing YAML output."""
+        formatter = YamlFormatter()
+        assert formatter.parse(formatter.format(sample_data)) == sample_data
+
     def test_name_and_extension(self):
         """Test formatter metadata."""
         formatter = YamlFormatter()
@@ -154,6 +185,180 @@ class TestYamlFormatter:
         assert formatter.file_extension == ".yaml"
 
 
+@pytest.fixture
+def repetitive_data():
+    """Index data where filenames repeat across many directories."""
+    directories = {"": ["README.md", "changelog.md"]}
+    for i in range(50):
+        directories[f"packages/pkg-{i:02d}"] = [
+            "README.md",
+            "changelog.md",
+            "index.mdx",
+            f"guide-{i}.mdx",
+            "overview.md",
+        ]
+    return IndexData(name="Monorepo Docs", root="./docs", directories=directories)
+
+
+class TestDictionaryFormatter:
+    """Tests for DictionaryFormatter."""
+
+    def test_dictionary_in_header(self, repetitive_data):
+        """Test that repeated names are emitted once in the header."""
+        result = DictionaryFormatter().format(repetitive_data)
+
+        lines = result.split("\n")
+        assert lines[0] == "[Monorepo Docs]|root: ./docs"
+        assert lines[1].startswith("|~names:")
+        assert lines[2] == "|~exts:.mdx"
+        assert result.count("README.md") == 1
+        assert "|packages/pkg-07:{" in result
+
+    def test_round_trip(self, repetitive_data, sample_data):
+        """Test that parse restores the formatted data."""
+        formatter = DictionaryFormatter()
+        for data in (repetitive_data, sample_data):
+            assert formatter.parse(formatter.format(data)) == data
+
+    def test_round_trip_special_characters(self):
+        """Test names that collide with the format syntax."""
+        data = IndexData(
+            name="Odd [Docs]|x",
+            root="./a:b",
+            directories={
+                "": ["a,b.md", "x{1}.md", "~0.md", "^y.md", "back\\slash.md"],
+                "we|ird:dir": ["a,b.md", "a,b.md", "café.md", "line\nbreak.md"],
+                "plain": ["~0.md", "^y.md", "README", "README", "README"],
+            },
+            instruction="Use: {this}|that",
+            metadata={"key:1": "{value}", "IMPORTANT": "not the instruction"},
+        )
+        formatter = DictionaryFormatter()
+        assert formatter.parse(formatter.format(data)) == data
+
+    def test_round_trip_compressed(self, repetitive_data):
+        """Test that output with newlines removed still parses."""
+        formatter = DictionaryFormatter()
+        compressed = formatter.format(repetitive_data).replace("\n", "")
+        assert formatter.parse(compressed) == repetitive_data
+
+    def test_smaller_than_pipe(self, repetitive_data):
+        """Benchmark: repeated names compress well against pipe output."""
+        pipe_size = len(PipeFormatter().format(repetitive_data))
+        dict_size = len(DictionaryFormatter().format(repetitive_data))
+        assert dict_size < pipe_size * 0.6
+
+    def test_no_larger_than_pipe_without_repeats(self, sample_data):
+        """Benchmark: without repeats the output matches pipe size."""
+        unique = IndexData(
+            name=sample_data.name,
+            root=sample_data.root,
+            directories={"": ["one.md"], "sub": ["two.txt"]},
+        )
+        assert DictionaryFormatter().format(unique) == PipeFormatter().format(unique)
+
+    def test_invalid_input(self):
+        """Test that non-dict text is rejected."""
+        with pytest.raises(ValueError, match="missing header"):
+            DictionaryFormatter().parse('{"name": "x"}')
+
+    def test_name_and_extension(self):
+        """Test formatter metadata."""
+        formatter = DictionaryFormatter()
+        assert formatter.name == "dict"
+        assert formatter.file_extension == ".md"
+
+
+class TestTruncationMarker:
+    """Tests for marking partial indexes in every format."""
+
+    @pytest.mark.parametrize("format_name", ["pipe", "json", "yaml", "dict"])
+    def test_round_trip(self, sample_data, format_name):
+        """Test that the truncation reason is emitted and parsed back."""
+        data = IndexData(**{**vars(sample_data), "truncated": "max files (3) reached"})
+        formatter = get_formatter(format_name)
+        result = formatter.format(data)
+
+        assert "max files (3) reached" in result
+        assert formatter.parse(result) == data
+
+    def test_pipe_marker(self, sample_data):
+        """Test the pipe truncation line follows the instruction."""
+        data = IndexData(**{**vars(sample_data), "truncated": "timeout (5s) reached"})
+        lines = PipeFormatter().format(data).split("\n")
+        assert lines[2] == "|TRUNCATED: timeout (5s) reached"
+
+
+class TestAnnotations:
+    """Tests for per-file annotations in every format."""
+
+    @pytest.fixture
+    def annotated_data(self, sample_data):
+        """Sample data with annotations on some files."""
+        return IndexData(
+            **{
+                **vars(sample_data),
+                "annotations": {
+                    "README.md": Annotation(size=512, lines=12, modified="2026-10-19"),
+                    "01-getting-started/install.mdx": Annotation(size=4096),
+                    "02-guides/overview.md": Annotation(lines=3),
+                },
+            }
+        )
+
+    def test_pipe_suffixes(self, annotated_data):
+        """Test the compact pipe rendering."""
+        result = PipeFormatter().format(annotated_data)
+
+        assert "|.:{README.md~512#12@2026-10-19}" in result
+        assert "|01-getting-started:{install.mdx~4k,config.mdx}" in result
+        assert "|02-guides:{overview.md#3}" in result
+
+    def test_dict_brackets(self, annotated_data):
+        """Test that dict annotations are bracketed and survive escaped names."""
+        data = IndexData(
+            name="Docs",
+            root=".",
+            directories={"": ["a[1]~2.md"]},
+            annotations={"a[1]~2.md": Annotation(size=1536)},
+        )
+        result = DictionaryFormatter().format(data)
+
+        assert r"a\[1\]\~2.md[~1.5k]" in result
+        assert DictionaryFormatter().parse(result) == data
+
+    @pytest.mark.parametrize("format_name", ["pipe", "json", "yaml", "dict"])
+    def test_round_trip(self, annotated_data, format_name):
+        """Test that annotations are parsed back (exact sizes under 1000 bytes)."""
+        formatter = get_formatter(format_name)
+
+        assert formatter.parse(formatter.format(annotated_data)) == annotated_data
+
+    def test_json_omits_unset_fields(self, annotated_data):
+        """Test the JSON annotations mapping."""
+        output = json.loads(JsonFormatter().format(annotated_data))
+
+        assert output["annotations"]["02-guides/overview.md"] == {"lines": 3}
+        assert output["annotations"]["README.md"] == {
+            "size": 512, "lines": 12, "modified": "2026-10-19",
+        }
+
+    def test_sizes_rounded_in_text_formats(self):
+        """Test compact sizes for larger files."""
+        data = IndexData(
+            name="Docs",
+            root=".",
+            directories={"": ["a.md", "b.md", "c.md"]},
+            annotations={
+                "a.md": Annotation(size=4400),
+                "b.md": Annotation(size=150_000),
+                "c.md": Annotation(size=3 * 1024 ** 3),
+            },
+        )
+
+        assert PipeFormatter().format(data).endswith("{a.md~4.3k,b.md~146k,c.md~3G}")
+
+
 class TestIndexData:
     """Tests for IndexData dataclass."""
 
@@ -0,0 +1,118 @@
+"""Tests for the links module."""
+
+import json
+
+import pytest
+
+from ai_docs_indexer import links
+from ai_docs_indexer.links import (
+    extract_links,
+    parse_link_targets,
+    rank_by_links,
+    select_by_links,
+)
+from ai_docs_indexer.scanner import scan_directory
+
+
+@pytest.fixture
+def linked_docs(tmp_path):
+    """Create docs that link to each other."""
+    (tmp_path / "guides").mkdir()
+    (tmp_path / "api").mkdir()
+    (tmp_path / "img.png").write_bytes(b"")
+    (tmp_path / "README.md").write_text(
+        "See [install](guides/install.md), [api](api/) and [usage](guides/usage#top).\n"
+        "![logo](img.png) [site](https://example.com) [top](#intro)\n"
+    )
+    (tmp_path / "guides" / "install.md").write_text(
+        "Back to [readme](../README.md). Missing [page](./missing.md).\n"
+        "```md\n[in code](../api/index.mdx)\n```\n"
+    )
+    (tmp_path / "guides" / "usage.md").write_text(
+        "[ref]: ../api/index.mdx \"API\"\n<a href=\"/guides/install.md\">install</a>\n"
+    )
+    (tmp_path / "api" / "index.mdx").write_text("[install](../guides/install.md)\n")
+    return tmp_path
+
+
+class TestParseLinkTargets:
+    """Tests for parse_link_targets."""
+
+    def test_inline_reference_and_href(self):
+        """Test all supported link syntaxes."""
+        text = (
+            '[a](one.md "Title") ![b](<two.png>)\n'
+            "[r]: three.md\n"
+            '<Link href="four.mdx" />\n'
+        )
+        assert parse_link_targets(text) == ["one.md", "two.png", "three.md", "four.mdx"]
+
+    def test_fenced_code_ignored(self):
+        """Test that links inside fenced code are skipped."""
+        assert parse_link_targets("```\n[a](one.md)\n```\n[b](two.md)") == ["two.md"]
+
+
+class TestExtractLinks:
+    """Tests for extract_links."""
+
+    def test_graph(self, linked_docs):
+        """Test edges, in-degrees and broken links."""
+        graph = extract_links(scan_directory(linked_docs))
+
+        assert graph.edges == {
+            "README.md": ["api/index.mdx", "guides/install.md", "guides/usage.md"],
+            "api/index.mdx": ["guides/install.md"],
+            "guides/install.md": ["README.md"],
+            "guides/usage.md": ["api/index.mdx", "guides/install.md"],
+        }
+        assert graph.in_degree["guides/install.md"] == 3
+        assert graph.in_degree["README.md"] == 1
+        assert graph.broken == {"guides/install.md": ["./missing.md"]}
+
+    def test_cache_skips_unchanged_files(self, linked_docs, tmp_path_factory, monkeypatch):
+        """Test that only changed files are reparsed on a second run."""
+        cache_path = tmp_path_factory.mktemp("cache") / "links.json"
+        result = scan_directory(linked_docs)
+        first = extract_links(result, cache_path=cache_path)
+        assert set(json.loads(cache_path.read_text())) == {
+            "README.md", "api/index.mdx", "guides/install.md", "guides/usage.md",
+        }
+
+        (linked_docs / "api" / "index.mdx").write_text("no links any more\n")
+        parsed = []
+        original = links._read_targets
+        monkeypatch.setattr(
+            links, "_read_targets", lambda path: parsed.append(path) or original(path)
+        )
+
+        second = extract_links(result, cache_path=cache_path)
+
+        assert [p.rsplit("/", 2)[-2:] for p in parsed] == [["api", "index.mdx"]]
+        assert "api/index.mdx" not in second.edges
+        assert second.edges["README.md"] == first.edges["README.md"]
+
+    def test_rank_by_links(self, linked_docs):
+        """Test that heavily linked files are listed first."""
+        result = scan_directory(linked_docs)
+        graph = extract_links(result)
+
+        ranked = rank_by_links(result.directories, graph)
+
+        assert ranked["guides"] == ["install.md", "usage.md"]
+        assert result.directories["guides"] == ["install.md", "usage.md"]
+
+        graph.in_degree["guides/usage.md"] = 5
+        assert rank_by_links(result.directories, graph)["guides"] == ["usage.md", "install.md"]
+
+    def test_select_by_links(self, linked_docs):
+        """Test that the budget keeps the most linked files across directories."""
+        result = scan_directory(linked_docs)
+        graph = extract_links(result)
+
+        selected = select_by_links(result.directories, graph, 2)
+
+        # install.md has three inbound links and api/index.mdx two
+        assert selected == {"api": ["index.mdx"], "guides": ["install.md"]}
+        # README.md and usage.md tie with one each; walk order breaks the tie
+        assert select_by_links(result.directories, graph, 3)[""] == ["README.md"]
+        assert select_by_links(result.directories, graph, 10) is result.directories
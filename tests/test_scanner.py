@@ -1,10 +1,12 @@
 """Tests for the scanner module."""
 
+import os
 from pathlib import Path
 
 import pytest
 
-from ai_docs_indexer.scanner import scan_directory
+from ai_docs_indexer import scanner
+from ai_docs_indexer.scanner import rescan_paths, scan_directory, scan_manifest
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -112,3 +114,344 @@ class TestScanDirectory:
         result = scan_directory(tmp_path)
 
         assert result.directories[""] == ["alpha.md", "beta.md", "zebra.md"]
+
+
+class TestLinkedTraversal:
+    """Tests for symlink and hard link handling."""
+
+    def test_symlink_cycle_terminates(self, tmp_path):
+        """Test that a symlink back to an ancestor is walked only once."""
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "doc.md").write_text("doc")
+        (sub / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+        result = scan_directory(tmp_path, follow_symlinks=True)
+
+        assert result.directories == {"sub": ["doc.md"]}
+        assert result.skipped == ("sub/loop/",)
+
+    def test_symlinked_copy_walked_once(self, tmp_path):
+        """Test that a symlinked subtree is listed under its first path only."""
+        real = tmp_path / "a-real"
+        real.mkdir()
+        (real / "doc.md").write_text("doc")
+        (tmp_path / "b-mirror").symlink_to(real, target_is_directory=True)
+
+        result = scan_directory(tmp_path, follow_symlinks=True)
+
+        assert list(result.directories) == ["a-real"]
+        assert result.skipped == ("b-mirror/",)
+
+    def test_hard_links_listed_by_default(self, tmp_path):
+        """Test that hard-linked files are kept without dedupe."""
+        (tmp_path / "a.md").write_text("doc")
+        (tmp_path / "b.md").hardlink_to(tmp_path / "a.md")
+
+        result = scan_directory(tmp_path)
+
+        assert result.directories[""] == ["a.md", "b.md"]
+        assert result.skipped == ()
+
+    def test_dedupe_hard_links(self, tmp_path):
+        """Test that dedupe_files drops hard-linked copies."""
+        (tmp_path / "a.md").write_text("doc")
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "b.md").hardlink_to(tmp_path / "a.md")
+        (sub / "c.md").symlink_to(tmp_path / "a.md")
+        (sub / "d.md").write_text("other")
+
+        result = scan_directory(tmp_path, dedupe_files=True)
+
+        assert result.directories == {"": ["a.md"], "sub": ["d.md"]}
+        assert result.skipped == ("sub/b.md", "sub/c.md")
+        assert result.total_files == 2
+
+
+class TestScanBudgets:
+    """Tests for scan limits."""
+
+    @pytest.fixture
+    def deep_tree(self, tmp_path):
+        """Create a tree with one doc per level, four levels deep."""
+        current = tmp_path
+        for level in range(4):
+            (current / f"doc{level}.md").write_text("")
+            (current / f"extra{level}.md").write_text("")
+            current = current / f"level{level + 1}"
+            current.mkdir()
+        return tmp_path
+
+    def test_complete_scan_not_truncated(self, deep_tree):
+        """Test that an unlimited scan is not flagged."""
+        result = scan_directory(deep_tree, max_depth=10, max_files=100, max_dirs=100)
+
+        assert result.total_files == 8
+        assert result.truncated is None
+
+    def test_max_depth(self, deep_tree):
+        """Test that directories below max_depth are pruned."""
+        result = scan_directory(deep_tree, max_depth=1)
+
+        assert list(result.directories) == ["", "level1"]
+        assert result.truncated == "max depth (1) reached"
+
+    def test_max_depth_zero(self, deep_tree):
+        """Test that max_depth=0 scans only the root directory."""
+        result = scan_directory(deep_tree, max_depth=0)
+
+        assert list(result.directories) == [""]
+
+    def test_max_files(self, deep_tree):
+        """Test that the walk stops once max_files is reached."""
+        result = scan_directory(deep_tree, max_files=3)
+
+        assert result.total_files == 3
+        assert result.directories == {
+            "": ["doc0.md", "extra0.md"],
+            "level1": ["doc1.md"],
+        }
+        assert result.truncated == "max files (3) reached"
+
+    def test_max_files_exact_is_complete(self, deep_tree):
+        """Test that hitting max_files exactly on the last file is not truncation."""
+        result = scan_directory(deep_tree, max_files=8)
+
+        assert result.total_files == 8
+        assert result.truncated is None
+
+    def test_max_dirs(self, deep_tree):
+        """Test that the walk stops after max_dirs directories."""
+        result = scan_directory(deep_tree, max_dirs=2)
+
+        assert list(result.directories) == ["", "level1"]
+        assert result.truncated == "max dirs (2) reached"
+
+    def test_timeout(self, deep_tree):
+        """Test that an expired timeout returns a partial result."""
+        result = scan_directory(deep_tree, timeout=1e-9)
+
+        assert result.truncated == "timeout (1e-09s) reached"
+        assert result.total_files == 0
+
+
+class TestStatFiles:
+    """Tests for collecting file stats during the walk."""
+
+    def test_not_collected_by_default(self, tmp_path):
+        """Test that plain scans carry no stat data."""
+        (tmp_path / "a.md").write_text("")
+
+        assert scan_directory(tmp_path).file_stats is None
+
+    def test_stats_for_listed_files(self, tmp_path):
+        """Test that every listed file, and only those, has stat data."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.md").write_text("hello")
+        (tmp_path / "sub" / "b.md").write_text("")
+        (tmp_path / "sub" / "c.txt").write_text("")
+
+        result = scan_directory(tmp_path, stat_files=True)
+
+        assert result.directories == scan_directory(tmp_path).directories
+        assert set(result.file_stats) == {"a.md", os.path.join("sub", "b.md")}
+        assert result.file_stats["a.md"].st_size == 5
+
+    def test_dangling_symlink_has_stats(self, tmp_path):
+        """Test that a listed dangling symlink still gets stat data."""
+        (tmp_path / "gone.md").symlink_to(tmp_path / "missing.md")
+
+        result = scan_directory(tmp_path, stat_files=True)
+
+        assert result.directories == {"": ["gone.md"]}
+        assert set(result.file_stats) == {"gone.md"}
+
+    def test_no_extra_stat_calls(self, tmp_path, monkeypatch):
+        """Test that stats come from the directory listing, not os.stat."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.md").write_text("")
+        (tmp_path / "sub" / "b.md").write_text("")
+
+        stat = os.stat
+        stat_calls = []
+
+        def counting_stat(path, *args, **kwargs):
+            stat_calls.append(os.fspath(path))
+            return stat(path, *args, **kwargs)
+
+        monkeypatch.setattr(scanner.os, "stat", counting_stat)
+        result = scan_directory(tmp_path, stat_files=True, dedupe_files=True)
+        monkeypatch.undo()
+
+        assert not [p for p in stat_calls if p.endswith(".md")]
+        assert len(result.file_stats) == 2
+
+    def test_budgets_apply(self, tmp_path):
+        """Test that stats are kept only for files within the budget."""
+        for name in ("a.md", "b.md", "c.md"):
+            (tmp_path / name).write_text("")
+
+        result = scan_directory(tmp_path, stat_files=True, max_files=2)
+
+        assert list(result.file_stats) == ["a.md", "b.md"]
+        assert result.truncated == "max files (2) reached"
+
+
+class TestRescanPaths:
+    """Tests for rescan_paths function."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        """Create a small docs tree."""
+        (tmp_path / "README.md").write_text("")
+        for name in ("guides", "guides/deep", "api"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "index.md").write_text("")
+        return tmp_path
+
+    def test_added_and_removed_files(self, tree):
+        """Test that parents of changed files are relisted."""
+        previous = scan_directory(tree).directories
+        (tree / "guides" / "new.md").write_text("")
+        (tree / "api" / "index.md").unlink()
+
+        result = rescan_paths(
+            tree, previous, [tree / "guides" / "new.md", tree / "api" / "index.md"]
+        )
+
+        assert result.directories == scan_directory(tree).directories
+        assert list(result.directories) == ["", "guides", "guides/deep"]
+        assert result.total_files == 4
+
+    def test_unchanged_entries_untouched(self, tree):
+        """Test that directories without reported changes are not relisted."""
+        previous = scan_directory(tree).directories
+        (tree / "api" / "unreported.md").write_text("")
+
+        result = rescan_paths(tree, previous, [tree / "README.md"])
+
+        assert result.directories["api"] == ["index.md"]
+
+    def test_deleted_directory(self, tree):
+        """Test that a deleted directory drops its subtree."""
+        previous = scan_directory(tree).directories
+        for path in (tree / "guides" / "deep" / "index.md", tree / "guides" / "index.md"):
+            path.unlink()
+        (tree / "guides" / "deep").rmdir()
+        (tree / "guides").rmdir()
+
+        result = rescan_paths(tree, previous, [tree / "guides"])
+
+        assert result.directories == {"": ["README.md"], "api": ["index.md"]}
+
+    def test_new_directory(self, tree):
+        """Test that a changed directory path rescans its subtree."""
+        previous = scan_directory(tree).directories
+        (tree / "blog" / "2024").mkdir(parents=True)
+        (tree / "blog" / "2024" / "post.md").write_text("")
+
+        result = rescan_paths(tree, previous, [tree / "blog"])
+
+        assert result.directories == scan_directory(tree).directories
+
+    def test_hidden_and_outside_paths_ignored(self, tree, tmp_path_factory):
+        """Test that hidden directories and paths outside the root are skipped."""
+        previous = scan_directory(tree).directories
+        (tree / ".drafts").mkdir()
+        (tree / ".drafts" / "wip.md").write_text("")
+        outside = tmp_path_factory.mktemp("other") / "x.md"
+        outside.write_text("")
+
+        result = rescan_paths(tree, previous, [tree / ".drafts" / "wip.md", outside])
+
+        assert result.directories == previous
+
+
+class TestScanManifest:
+    """Tests for scan_manifest function."""
+
+    ENTRIES = [
+        "./README.md",
+        "./guides/b.md",
+        "./guides/a.mdx",
+        "./guides/notes.txt",
+        "./.github/x.md",
+        "./guides/.draft.md",
+        "./api/v1/ref.md",
+    ]
+
+    EXPECTED = {
+        "": ["README.md"],
+        "api/v1": ["ref.md"],
+        "guides": ["a.mdx", "b.md"],
+    }
+
+    def test_nul_separated(self, tmp_path):
+        """Test a find -print0 style manifest."""
+        manifest = tmp_path / "manifest"
+        manifest.write_bytes(b"\0".join(e.encode() for e in self.ENTRIES) + b"\0")
+
+        result = scan_manifest(manifest, "/srv/docs")
+
+        assert result.directories == self.EXPECTED
+        assert list(result.directories) == ["", "api/v1", "guides"]
+        assert result.total_files == 4
+        assert result.root_path == Path("/srv/docs")
+
+    def test_newline_separated_absolute(self, tmp_path):
+        """Test newline-separated absolute paths, including CRLF and outside paths."""
+        manifest = tmp_path / "manifest"
+        lines = [e.replace("./", "/srv/docs/", 1) for e in self.ENTRIES]
+        lines.append("/srv/other/outside.md")
+        manifest.write_text("\r\n".join(lines) + "\r\n")
+
+        result = scan_manifest(manifest, "/srv/docs")
+
+        assert result.directories == self.EXPECTED
+
+    def test_include_hidden(self, tmp_path):
+        """Test that hidden filtering matches scan_directory."""
+        manifest = tmp_path / "manifest"
+        manifest.write_text("\n".join(self.ENTRIES))
+
+        result = scan_manifest(manifest, "/srv/docs", include_hidden=True)
+
+        assert result.directories[".github"] == ["x.md"]
+        assert result.directories["guides"] == [".draft.md", "a.mdx", "b.md"]
+
+    def test_chunk_boundaries(self, tmp_path, monkeypatch):
+        """Test that entries split across chunks are reassembled."""
+        monkeypatch.setattr(scanner, "_MANIFEST_CHUNK", 16)
+        manifest = tmp_path / "manifest"
+        manifest.write_bytes(b"\0".join(e.encode() for e in self.ENTRIES))
+
+        result = scan_manifest(manifest, "/srv/docs")
+
+        assert result.directories == self.EXPECTED
+
+    def test_budgets(self, tmp_path):
+        """Test that max_depth and max_files match a budgeted walk."""
+        tree = tmp_path / "tree"
+        for entry in self.ENTRIES:
+            path = tree / entry
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+        manifest = tmp_path / "manifest"
+        manifest.write_text("\n".join(self.ENTRIES))
+
+        for budget in ({"max_depth": 0}, {"max_depth": 1}, {"max_files": 2}, {"max_files": 4}):
+            result = scan_manifest(manifest, tree, **budget)
+            expected = scan_directory(tree, **budget)
+            assert result.directories == expected.directories, budget
+            assert result.truncated == expected.truncated, budget
+
+    def test_empty_manifest(self, tmp_path):
+        """Test that an empty manifest yields an empty result."""
+        manifest = tmp_path / "manifest"
+        manifest.write_bytes(b"")
+
+        result = scan_manifest(manifest, "/srv/docs")
+
+        assert result.directories == {}
+        assert result.total_files == 0
@@ -0,0 +1,77 @@
+"""Tests for the stats module."""
+
+import pytest
+
+from ai_docs_indexer.formatters import IndexData, PipeFormatter
+from ai_docs_indexer.stats import compute_stats, estimate_tokens
+
+
+@pytest.fixture
+def nested_data():
+    """Index data with nested directories and repeated names."""
+    return IndexData(
+        name="Test Docs",
+        root="./docs",
+        directories={
+            "": ["README.md"],
+            "guides": ["README.md", "overview.md"],
+            "vendor/a": ["README.md", "install.md", "usage.md"],
+            "vendor/b": ["README.md"],
+        },
+    )
+
+
+class TestEstimateTokens:
+    """Tests for estimate_tokens."""
+
+    def test_empty(self):
+        """Test that empty text has no tokens."""
+        assert estimate_tokens("") == 0
+
+    def test_words_and_punctuation(self):
+        """Test word runs and punctuation are counted separately."""
+        # "README" -> 2, "." -> 1, "md" -> 1
+        assert estimate_tokens("README.md") == 4
+
+    def test_digits(self):
+        """Test digit runs count one token per three digits."""
+        assert estimate_tokens("1234567") == 3
+
+
+class TestComputeStats:
+    """Tests for compute_stats."""
+
+    def test_format_sizes(self, nested_data):
+        """Test that each requested format is measured."""
+        stats = compute_stats(nested_data, ["pipe", "json"])
+
+        rendered = PipeFormatter().format(nested_data)
+        assert set(stats.formats) == {"pipe", "json"}
+        assert stats.formats["pipe"].bytes == len(rendered.encode("utf-8"))
+        assert stats.formats["pipe"].tokens == estimate_tokens(rendered)
+
+    def test_directory_bytes_match_pipe_entries(self, nested_data):
+        """Test per-directory bytes equal the pipe entry lengths."""
+        stats = compute_stats(nested_data, [])
+
+        assert stats.directories["guides"].bytes == len("|guides:{README.md,overview.md}\n")
+        assert stats.directories[""].bytes == len("|.:{README.md}\n")
+
+    def test_subtree_rollup(self, nested_data):
+        """Test that subtree totals include descendants."""
+        stats = compute_stats(nested_data, [])
+
+        vendor = stats.directories["vendor"]
+        assert vendor.files == 0
+        assert vendor.subtree_files == 4
+        assert vendor.subtree_bytes == (
+            stats.directories["vendor/a"].bytes + stats.directories["vendor/b"].bytes
+        )
+        assert stats.directories[""].subtree_files == 7
+
+    def test_name_counts(self, nested_data):
+        """Test repeated filename frequencies."""
+        stats = compute_stats(nested_data, [])
+
+        assert stats.name_counts["README.md"] == 4
+        assert stats.name_counts["usage.md"] == 1